@@ -0,0 +1,12 @@
+from benchmarks.common import measure
+from benchmarks.mock_server import MockCatalogueServer
+from utils.extract import scrape_products
+
+def run(pages: int = 50, cards_per_page: int = 20, latency: float = 0.02, workers=(1, 4, 8), repeat: int = 3) -> dict:
+    results = {}
+    with MockCatalogueServer(pages=pages, cards_per_page=cards_per_page, latency=latency) as server:
+        for count in workers:
+            results[f"extract.workers={count}"] = measure(
+                lambda: scrape_products(delay=0, workers=count, root_url=server.url), repeat=repeat
+            )
+    return results
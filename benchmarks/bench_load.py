@@ -0,0 +1,67 @@
+import os
+import shutil
+import tempfile
+
+from benchmarks.bench_transform import make_rows
+from benchmarks.common import measure
+from utils.load import load_to_csv, load_to_parquet
+from utils.postgres import dispose_engines, load_to_postgresql, load_to_postgresql_upsert
+from utils.sheets import sync_to_google_sheets
+from utils.transform import transform_data
+
+class _Request:
+
+    def __init__(self, result=None):
+        self.result = result or {}
+
+    def execute(self):
+        return self.result
+
+class NullSheetsService:
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def get(self, **kwargs):
+        return _Request({'values': []})
+
+    def batchUpdate(self, **kwargs):
+        return _Request()
+
+    def batchClear(self, **kwargs):
+        return _Request()
+
+def run(rows: int = 100_000, repeat: int = 3, pg_url: str = None) -> dict:
+    df = transform_data(make_rows(rows))
+    workdir = tempfile.mkdtemp(prefix="bench-load-")
+    results = {}
+    try:
+        csv_path = os.path.join(workdir, "products.csv")
+        results[f"load.csv[{rows}]"] = measure(lambda: load_to_csv(df, csv_path), repeat=repeat)
+
+        parquet_root = os.path.join(workdir, "parquet")
+        results[f"load.parquet[{rows}]"] = measure(
+            lambda: load_to_parquet(df, parquet_root), repeat=repeat,
+            setup=lambda: shutil.rmtree(parquet_root, ignore_errors=True),
+        )
+
+        sqlite_url = f"sqlite:///{os.path.join(workdir, 'products.db')}"
+        results[f"load.sqlite_to_sql[{rows}]"] = measure(
+            lambda: load_to_postgresql(df, sqlite_url, "fashion_products"), repeat=repeat
+        )
+
+        results[f"load.sheets_sync_fake[{rows}]"] = measure(
+            lambda: sync_to_google_sheets(df, "BENCH", service=NullSheetsService()), repeat=repeat
+        )
+
+        if pg_url:
+            results[f"load.postgresql_upsert[{rows}]"] = measure(
+                lambda: load_to_postgresql_upsert(df, pg_url, "bench_products"), repeat=repeat
+            )
+    finally:
+        dispose_engines()
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
@@ -0,0 +1,13 @@
+from benchmarks.common import measure
+from benchmarks.mock_server import render_page
+from utils.parsers import PARSERS, etree
+
+def run(pages: int = 50, cards_per_page: int = 20, repeat: int = 3) -> dict:
+    bodies = [render_page(n, pages, cards_per_page).encode("utf-8") for n in range(1, pages + 1)]
+    results = {}
+    for name, parser_class in PARSERS.items():
+        if name == "lxml" and etree is None:
+            continue
+        parser = parser_class()
+        results[f"parse.{name}"] = measure(lambda: [parser.parse(body) for body in bodies], repeat=repeat)
+    return results
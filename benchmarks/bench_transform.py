@@ -0,0 +1,68 @@
+import argparse
+import contextlib
+import io
+import random
+import time
+import tracemalloc
+
+from benchmarks.common import measure
+from utils.transform import transform_data, transform_data_fast
+
+SIZES = ['S', 'M', 'L', 'XL', 'XXL']
+GENDERS = ['Men', 'Women', 'Unisex']
+
+CANDIDATES = {
+    "transform_data": transform_data,
+    "transform_data_fast": transform_data_fast,
+    "transform_data_fast[pyarrow]": lambda data: transform_data_fast(data, dtype_backend="pyarrow"),
+}
+
+def make_rows(n, seed=0):
+    rng = random.Random(seed)
+    timestamp = "2025-11-14T19:37:27.095822"
+    rows = []
+    for i in range(n):
+        roll = rng.random()
+        rows.append({
+            'Title': 'Unknown Product' if roll < 0.02 else f"Product {i}",
+            'Price': 'Price Unavailable' if 0.02 <= roll < 0.04 else f"${rng.uniform(10, 500):.2f}",
+            'Rating': 'Not Rated' if 0.04 <= roll < 0.06 else f"Rating: ⭐ {rng.uniform(1, 5):.1f} / 5",
+            'Colors': f"{rng.randint(1, 8)} Colors",
+            'Size': f"Size: {rng.choice(SIZES)}",
+            'Gender': f"Gender: {rng.choice(GENDERS)}",
+            'timestamp': timestamp,
+        })
+    return rows
+
+def run(sizes=(1_000, 100_000, 1_000_000), repeat: int = 3) -> dict:
+    results = {}
+    for size in sizes:
+        rows = make_rows(size)
+        for name, fn in CANDIDATES.items():
+            results[f"{name}[{size}]"] = measure(lambda: fn(rows), repeat=1 if size >= 1_000_000 else repeat)
+    return results
+
+def measure_memory(fn, rows):
+    tracemalloc.start()
+    start = time.perf_counter()
+    df = fn(rows)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, df.memory_usage(deep=True).sum()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare run time and result memory of transform_data and transform_data_fast")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    rows = make_rows(args.rows)
+
+    print(f"{'fungsi':<30}{'waktu (s)':>12}{'peak alloc (MB)':>18}{'hasil (MB)':>14}")
+    for name, fn in CANDIDATES.items():
+        with contextlib.redirect_stdout(io.StringIO()):
+            elapsed, peak, size = measure_memory(fn, rows)
+        print(f"{name:<30}{elapsed:>12.2f}{peak / 2**20:>18.1f}{size / 2**20:>14.1f}")
+
+if __name__ == "__main__":
+    main()
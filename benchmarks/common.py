@@ -0,0 +1,58 @@
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+from datetime import datetime
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+def measure(fn, repeat: int = 3, setup=None) -> dict:
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return {"min": min(timings), "median": statistics.median(timings), "repeat": repeat}
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def save_results(results: dict, results_dir: str = RESULTS_DIR) -> str:
+    os.makedirs(results_dir, exist_ok=True)
+    commit = git_commit()
+    record = {
+        "commit": commit,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "results": results,
+    }
+    path = os.path.join(results_dir, f"{record['created_at'].replace(':', '')}-{commit}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(record, f, indent=2)
+    return path
+
+def load_results(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+def compare(baseline: dict, current: dict) -> str:
+    lines = [f"{'benchmark':<45}{'baseline (s)':>14}{'sekarang (s)':>14}{'rasio':>8}"]
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            lines.append(f"{name:<45}{'-':>14}{result['median']:>14.4f}{'-':>8}")
+            continue
+        ratio = result["median"] / before["median"] if before["median"] else float("nan")
+        lines.append(f"{name:<45}{before['median']:>14.4f}{result['median']:>14.4f}{ratio:>8.2f}")
+    return "\n".join(lines)
@@ -0,0 +1,144 @@
+import hashlib
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SIZES = ['S', 'M', 'L', 'XL', 'XXL']
+GENDERS = ['Men', 'Women', 'Unisex']
+KINDS = ['T-shirt', 'Hoodie', 'Pants', 'Jacket', 'Outerwear', 'Shoes']
+
+CARD_TEMPLATE = """
+        <div class="collection-card">
+            <div style="position: relative;">
+                <img src="https://picsum.photos/280/350?random={index}" class="collection-image" alt="{title}">
+            </div>
+            <div class="product-details">
+                <h3 class="product-title">{title}</h3>
+                <div class="price-container"><span class="price">{price}</span></div>
+                <p style="font-size: 14px; color: #777;">Rating: {rating}</p>
+                <p style="font-size: 14px; color: #777;">{colors} Colors</p>
+                <p style="font-size: 14px; color: #777;">Size: {size}</p>
+                <p style="font-size: 14px; color: #777;">Gender: {gender}</p>
+            </div>
+        </div>"""
+
+def render_card(index: int, rng: random.Random) -> str:
+    roll = rng.random()
+    if roll < 0.02:
+        title, price, rating = "Unknown Product", "$100.00", "Invalid Rating / 5"
+    elif roll < 0.04:
+        title, price, rating = f"{rng.choice(KINDS)} {index}", "Price Unavailable", "Not Rated"
+    else:
+        title = f"{rng.choice(KINDS)} {index}"
+        price = f"${rng.uniform(10, 500):.2f}"
+        rating = f"⭐ {rng.uniform(1, 5):.1f} / 5"
+    return CARD_TEMPLATE.format(
+        index=index,
+        title=title,
+        price=price,
+        rating=rating,
+        colors=rng.randint(1, 8),
+        size=rng.choice(SIZES),
+        gender=rng.choice(GENDERS),
+    )
+
+def render_page(page_number: int, pages: int, cards_per_page: int, seed: int = 0) -> str:
+    cards = ""
+    if page_number <= pages:
+        rng = random.Random(seed * 1_000_003 + page_number)
+        start = (page_number - 1) * cards_per_page
+        cards = "".join(render_card(start + i + 1, rng) for i in range(cards_per_page))
+
+    links = "".join(
+        f'<li class="page-item"><a class="page-link" href="/page{n}">{n}</a></li>' if n > 1
+        else '<li class="page-item"><a class="page-link" href="/">1</a></li>'
+        for n in range(1, pages + 1)
+    )
+    return (
+        '<!DOCTYPE html><html lang="en"><head><meta charset="UTF-8"><title>Fashion Studio</title></head>'
+        f'<body><div class="collection-grid" id="collectionList">{cards}</div>'
+        f'<ul class="pagination">{links}</ul></body></html>'
+    )
+
+class MockCatalogueServer:
+
+    def __init__(self, pages: int = 50, cards_per_page: int = 20, latency: float = 0.0, seed: int = 0):
+        self.pages = pages
+        self.cards_per_page = cards_per_page
+        self.latency = latency
+        self.seed = seed
+        self.requests = 0
+        self._bodies = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}"
+
+    def body(self, page_number: int) -> bytes:
+        with self._lock:
+            if page_number not in self._bodies:
+                self._bodies[page_number] = render_page(page_number, self.pages, self.cards_per_page, self.seed).encode("utf-8")
+            return self._bodies[page_number]
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                with server._lock:
+                    server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+
+                path = self.path.rstrip("/")
+                if path == "":
+                    page_number = 1
+                elif path.startswith("/page") and path[5:].isdigit():
+                    page_number = int(path[5:])
+                else:
+                    self.send_error(404)
+                    return
+
+                body = server.body(page_number)
+                etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("ETag", etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,43 @@
+import argparse
+import contextlib
+import io
+
+from benchmarks import bench_extract, bench_load, bench_parse, bench_transform
+from benchmarks.common import compare, load_results, save_results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Jalankan benchmark pipeline ETL dan simpan hasilnya")
+    parser.add_argument("--only", nargs="+", choices=["extract", "parse", "transform", "load"],
+                        default=["extract", "parse", "transform", "load"])
+    parser.add_argument("--quick", action="store_true", help="Ukuran data kecil untuk pengecekan cepat")
+    parser.add_argument("--pg-url", help="URL PostgreSQL lokal untuk benchmark upsert")
+    parser.add_argument("--compare", help="File hasil sebelumnya sebagai baseline")
+    parser.add_argument("--no-save", action="store_true", help="Jangan simpan hasil ke benchmarks/results")
+    args = parser.parse_args(argv)
+
+    suites = {
+        "extract": lambda: bench_extract.run(pages=10 if args.quick else 50),
+        "parse": lambda: bench_parse.run(pages=10 if args.quick else 50),
+        "transform": lambda: bench_transform.run(sizes=(1_000, 10_000) if args.quick else (1_000, 100_000, 1_000_000)),
+        "load": lambda: bench_load.run(rows=10_000 if args.quick else 100_000, pg_url=args.pg_url),
+    }
+
+    results = {}
+    for name in args.only:
+        print(f"Menjalankan benchmark {name}...")
+        with contextlib.redirect_stdout(io.StringIO()):
+            results.update(suites[name]())
+
+    for name, result in results.items():
+        print(f"{name:<45}{result['median']:>10.4f} s (min {result['min']:.4f} s)")
+
+    record = {"results": results}
+    if not args.no_save:
+        path = save_results(results)
+        print(f"Hasil disimpan ke {path}")
+
+    if args.compare:
+        print(compare(load_results(args.compare), record))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import shutil
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch, MagicMock
+from utils.cache import HttpCache, content_hash
+from utils.extract import Fetcher, fetching_content, iter_page_products
+from benchmarks.mock_server import MockCatalogueServer
+
+class TestCache(TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.url = "http://fake-url.com/"
+        self.headers = {'ETag': '"abc"', 'Last-Modified': 'Fri, 14 Nov 2025 10:00:00 GMT'}
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_store_and_conditional_headers(self):
+        cache = HttpCache(self.cache_dir)
+        cache.store(self.url, b"<html></html>", self.headers)
+
+        reopened = HttpCache(self.cache_dir)
+        entry = reopened.lookup(self.url)
+
+        self.assertEqual(reopened.read_body(self.url), b"<html></html>")
+        self.assertEqual(reopened.conditional_headers(entry), {
+            'If-None-Match': '"abc"',
+            'If-Modified-Since': 'Fri, 14 Nov 2025 10:00:00 GMT',
+        })
+
+    def test_ttl_expiry(self):
+        cache = HttpCache(self.cache_dir, ttl=0)
+        cache.store(self.url, b"body", {})
+
+        self.assertFalse(cache.is_fresh(cache.lookup(self.url)))
+
+    def test_lru_eviction_respects_size_cap(self):
+        cache = HttpCache(self.cache_dir, max_bytes=10)
+        cache.store("http://a/", b"aaaa", {})
+        cache.store("http://b/", b"bbbb", {})
+        cache.read_body("http://a/")
+        cache.store("http://c/", b"cccc", {})
+
+        self.assertIsNotNone(cache.lookup("http://a/"))
+        self.assertIsNone(cache.lookup("http://b/"))
+        self.assertIsNotNone(cache.lookup("http://c/"))
+
+    def test_products_reused_only_for_same_hash(self):
+        cache = HttpCache(self.cache_dir)
+        cache.store(self.url, b"v1", {})
+        cache.store_products(self.url, content_hash(b"v1"), [{'Title': 'Fake'}])
+
+        self.assertEqual(cache.load_products(self.url, content_hash(b"v1")), [{'Title': 'Fake'}])
+
+        cache.store(self.url, b"v2", {})
+        self.assertIsNone(cache.load_products(self.url, content_hash(b"v2")))
+
+    def test_cached_products_get_a_fresh_timestamp(self):
+        with MockCatalogueServer(pages=1, cards_per_page=3) as server:
+            runs = []
+            for _ in range(2):
+                with Fetcher(cache=HttpCache(self.cache_dir, ttl=0)) as fetcher:
+                    runs.append(list(iter_page_products(delay=0, fetcher=fetcher, root_url=server.url, end_page=1)))
+
+        (_, first), = runs[0]
+        (_, second), = runs[1]
+        self.assertEqual([p._replace(timestamp=None) for p in first], [p._replace(timestamp=None) for p in second])
+        self.assertGreater(second[0].timestamp, first[0].timestamp)
+        self.assertEqual(len({p.timestamp for p in second}), 1)
+
+    @patch('utils.extract.requests.Session')
+    def test_fetcher_revalidates_with_conditional_get(self, mock_session):
+        cache = HttpCache(self.cache_dir, ttl=0)
+        cache.store(self.url, b"cached body", self.headers)
+
+        not_modified = MagicMock(status_code=304)
+        mock_session.return_value.get.return_value = not_modified
+
+        with Fetcher(cache=cache) as fetcher:
+            content = fetching_content(self.url, fetcher=fetcher)
+
+        self.assertEqual(content, b"cached body")
+        _, kwargs = mock_session.return_value.get.call_args
+        self.assertEqual(kwargs['headers']['If-None-Match'], '"abc"')
+
+    @patch('utils.extract.requests.Session')
+    def test_fetcher_serves_fresh_entry_without_request(self, mock_session):
+        cache = HttpCache(self.cache_dir, ttl=3600)
+        cache.store(self.url, b"cached body", self.headers)
+
+        with Fetcher(cache=cache) as fetcher:
+            content = fetching_content(self.url, fetcher=fetcher)
+
+        self.assertEqual(content, b"cached body")
+        mock_session.return_value.get.assert_not_called()
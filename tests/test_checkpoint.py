@@ -0,0 +1,86 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from benchmarks.mock_server import MockCatalogueServer
+from utils.checkpoint import CrawlCheckpoint, checkpoint_path
+from utils import extract
+from utils.cache import HttpCache
+from utils.extract import Fetcher, scrape_products, scrape_product_columns
+from utils.records import Product
+
+class TestCheckpoint(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "crawl.jsonl")
+        self.product = Product('Fake T-Shirt', '$100.00', 'Rating: ⭐ 4.0 / 5', '3 Colors', 'Size: M', 'Gender: Men', '2025-11-14T19:37:27')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_resume_reads_completed_pages_and_ignores_torn_tail(self):
+        with CrawlCheckpoint(self.path, scope={"root_url": "x"}) as checkpoint:
+            checkpoint.record(1, [self.product])
+            checkpoint.record(2, [])
+        with open(self.path, "ab") as f:
+            f.write(b'{"page": 3, "produ')
+
+        with CrawlCheckpoint(self.path, resume=True, scope={"root_url": "x"}) as checkpoint:
+            self.assertEqual(checkpoint.pages, {1: [self.product], 2: []})
+            self.assertEqual(checkpoint.last_page, 1)
+            checkpoint.record(3, [self.product])
+
+        with CrawlCheckpoint(self.path, resume=True, scope={"root_url": "x"}) as checkpoint:
+            self.assertEqual(sorted(checkpoint.pages), [1, 2, 3])
+
+        with CrawlCheckpoint(self.path, resume=True, scope={"root_url": "y"}) as checkpoint:
+            self.assertEqual(checkpoint.pages, {})
+
+    def test_checkpoint_path_per_shard(self):
+        self.assertEqual(checkpoint_path("a/crawl.jsonl"), "a/crawl.jsonl")
+        self.assertEqual(checkpoint_path("a/crawl.jsonl", 1, 4), "a/crawl.shard1-of-4.jsonl")
+
+    def test_resumed_crawl_skips_completed_pages(self):
+        with MockCatalogueServer(pages=4, cards_per_page=3) as server:
+            first = scrape_products(delay=0, root_url=server.url, end_page=2, checkpoint=self.path)
+            requests_before = server.requests
+
+            resumed = scrape_products(delay=0, root_url=server.url, checkpoint=self.path, resume=True)
+            fetched = server.requests - requests_before
+
+        self.assertEqual(resumed[:len(first)], first)
+        self.assertEqual(len(resumed), 12)
+        self.assertEqual(fetched, 3)
+
+    def test_unparseable_page_is_reported_and_retried_on_resume(self):
+        parse = extract._timed_parse
+
+        def broken_page_two(content, parser):
+            if b'random=4"' in content:
+                raise ValueError("markup rusak")
+            return parse(content, parser)
+
+        with MockCatalogueServer(pages=3, cards_per_page=3) as server:
+            with patch('utils.extract._timed_parse', side_effect=broken_page_two):
+                partial = scrape_product_columns(delay=0, root_url=server.url, end_page=3, checkpoint=self.path)
+            resumed = scrape_product_columns(delay=0, root_url=server.url, end_page=3, checkpoint=self.path, resume=True)
+
+        self.assertEqual(partial.failed_pages, [2])
+        self.assertEqual(len(partial), 6)
+        self.assertEqual(resumed.failed_pages, [])
+        self.assertEqual(len(resumed), 9)
+
+    def test_cache_errors_fail_the_page_instead_of_the_crawl(self):
+        with MockCatalogueServer(pages=2, cards_per_page=3) as server, \
+                Fetcher(cache=HttpCache(os.path.join(self.tmpdir, "http"))) as fetcher, \
+                patch.object(HttpCache, 'load_products', side_effect=OSError("disk penuh")):
+            columns = scrape_product_columns(delay=0, fetcher=fetcher, root_url=server.url, end_page=2, parse_workers=1)
+
+        self.assertEqual(columns.failed_pages, [1, 2])
+        self.assertEqual(len(columns), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,14 @@
-from unittest import TestCase
+from unittest import TestCase, skipIf
 from unittest.mock import patch, MagicMock
 import requests 
 from bs4 import BeautifulSoup
-from utils.extract import fetching_content, extract_product_data, scrape_products
+from utils.parsers import SoupParser, LxmlParser, get_parser, etree
+from benchmarks.mock_server import MockCatalogueServer
+from utils.metrics import METRICS
+from utils.extract import (
+    fetching_content, extract_product_data, scrape_products, RateLimiter, Fetcher,
+    discover_page_count, shard_pages, scrape_products_sharded
+)
 
 class TestExtract(TestCase):
 
@@ -69,6 +75,30 @@ class TestExtract(TestCase):
         
         self.assertIsNone(result)
 
+    @patch('utils.extract.requests.Session')
+    def test_fetching_content_reuses_injected_fetcher(self, mock_session):
+        mock_get = MagicMock()
+        mock_get.content = b"Success HTML"
+        mock_session.return_value.get.return_value = mock_get
+
+        with Fetcher(pool_size=4, timeout=5) as fetcher:
+            fetching_content("http://fake-url.com/1", fetcher=fetcher)
+            fetching_content("http://fake-url.com/2", fetcher=fetcher)
+
+        mock_session.assert_called_once()
+        mock_session.return_value.close.assert_called_once()
+        _, kwargs = mock_session.return_value.get.call_args
+        self.assertEqual(kwargs['timeout'], 5)
+
+    def test_fetcher_retries_on_throttling_and_server_errors(self):
+        fetcher = Fetcher(retries=5, backoff_factor=1)
+        retry = fetcher.session.get_adapter("https://fake-url.com").max_retries
+
+        self.assertEqual(retry.total, 5)
+        self.assertIn(429, retry.status_forcelist)
+        self.assertIn(503, retry.status_forcelist)
+        fetcher.close()
+
     def test_extract_product_data_success(self):
         soup = BeautifulSoup(self.fake_html_page_1, "html.parser")
         card = soup.find('div', class_='collection-card')
@@ -93,6 +123,19 @@ class TestExtract(TestCase):
         self.assertEqual(product['Price'], 'Price Unavailable')
         self.assertEqual(product['Rating'], 'Rating: Not Rated')
 
+    @skipIf(etree is None, "lxml belum terinstall")
+    def test_lxml_parser_matches_soup_parser(self):
+        fixtures = [self.fake_html_page_1, self.fake_html_page_2, self.fake_html_price_unavailable]
+
+        for html in fixtures + [html.encode('utf-8') for html in fixtures]:
+            expected = [p._replace(timestamp=None) for p in SoupParser().parse(html)]
+            actual = [p._replace(timestamp=None) for p in LxmlParser().parse(html)]
+            self.assertEqual(actual, expected)
+
+    def test_get_parser_rejects_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            get_parser("regex")
+
     @patch('utils.extract.fetching_content')
     def test_scrape_products_loop(self, mock_fetching_content):
         responses = [self.fake_html_page_1, self.fake_html_page_2]
@@ -119,4 +162,81 @@ class TestExtract(TestCase):
         self.assertEqual(len(data), 1)
         self.assertEqual(data[0]['Title'], 'Fake T-Shirt')
         
-        self.assertEqual(mock_fetching_content.call_count, 3)
\ No newline at end of file
+        self.assertEqual(mock_fetching_content.call_count, 4)
+
+    @patch('utils.extract.fetching_content')
+    def test_scrape_products_retries_failed_pages_at_the_end(self, mock_fetching_content):
+        responses = [None, self.fake_html_price_unavailable, self.fake_html_page_2, self.fake_html_page_1]
+        mock_fetching_content.side_effect = responses
+
+        data = scrape_products(delay=0)
+
+        self.assertEqual([p['Title'] for p in data], ['Pants 46', 'Fake T-Shirt', 'Fake Hoodie'])
+        self.assertEqual(mock_fetching_content.call_args_list[-1][0][0], "https://fashion-studio.dicoding.dev/")
+
+    @patch('utils.extract.fetching_content')
+    def test_scrape_products_concurrent_keeps_page_order(self, mock_fetching_content):
+        pages = {
+            "https://fashion-studio.dicoding.dev/": self.fake_html_page_1,
+            "https://fashion-studio.dicoding.dev/page2": self.fake_html_price_unavailable,
+            "https://fashion-studio.dicoding.dev/page3": self.fake_html_page_2,
+        }
+        mock_fetching_content.side_effect = lambda url, **kwargs: pages.get(url, self.fake_html_page_2)
+
+        data = scrape_products(workers=4)
+
+        self.assertEqual([p['Title'] for p in data], ['Fake T-Shirt', 'Fake Hoodie', 'Pants 46'])
+        self.assertLessEqual(mock_fetching_content.call_count, 3 + 4)
+
+    @patch('utils.extract.fetching_content')
+    def test_scrape_products_process_pool_parsing(self, mock_fetching_content):
+        responses = [self.fake_html_page_1, None, self.fake_html_price_unavailable, self.fake_html_page_2]
+        mock_fetching_content.side_effect = responses + [self.fake_html_page_2] * 46
+
+        METRICS.reset()
+        data = scrape_products(parse_workers=2)
+
+        self.assertEqual([p['Title'] for p in data], ['Fake T-Shirt', 'Fake Hoodie', 'Pants 46'])
+        self.assertEqual(METRICS.counters["products_parsed"], 3)
+        self.assertEqual(METRICS.timers["parse"]["count"], 4)
+
+    @patch('utils.extract.time.sleep')
+    def test_rate_limiter_spaces_requests(self, mock_sleep):
+        limiter = RateLimiter(10)
+
+        limiter.wait()
+        limiter.wait()
+
+        self.assertEqual(mock_sleep.call_count, 1)
+        self.assertAlmostEqual(mock_sleep.call_args[0][0], 0.1, places=2)
+
+    def test_scrape_products_against_mock_server(self):
+        with MockCatalogueServer(pages=3, cards_per_page=5) as server:
+            serial = scrape_products(delay=0, root_url=server.url)
+            concurrent = scrape_products(delay=0, workers=4, root_url=server.url)
+
+        self.assertEqual(len(serial), 15)
+        strip = lambda rows: [row._replace(timestamp=None) for row in rows]
+        self.assertEqual(strip(concurrent), strip(serial))
+
+    def test_discover_page_count_and_sharding(self):
+        with MockCatalogueServer(pages=7, cards_per_page=2) as server:
+            self.assertEqual(discover_page_count(root_url=server.url), 7)
+
+            full = scrape_products(delay=0, root_url=server.url, end_page=60, discover_pages=True)
+            METRICS.reset()
+            sharded = scrape_products_sharded(3, delay=0, root_url=server.url, end_page=7)
+            sharded_fetches = METRICS.counters["pages_fetched"]
+            requests_made = server.requests
+
+        self.assertEqual(len(full), 14)
+        self.assertEqual([p['Title'] for p in sharded], [p['Title'] for p in full])
+        self.assertLess(requests_made, 1 + 7 + 7 + 3)
+        self.assertGreaterEqual(sharded_fetches, 7)
+
+    def test_shard_pages_are_disjoint(self):
+        shards = [list(shard_pages(1, 10, index, 3)) for index in range(3)]
+
+        self.assertEqual(sorted(sum(shards, [])), list(range(1, 11)))
+        with self.assertRaises(ValueError):
+            shard_pages(1, 10, 3, 3)
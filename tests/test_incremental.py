@@ -0,0 +1,139 @@
+import os
+import shutil
+import tempfile
+import warnings
+import pandas as pd
+from unittest import TestCase
+from unittest.mock import patch
+import main
+from benchmarks.mock_server import MockCatalogueServer
+from utils.incremental import FingerprintIndex, fingerprint, merge_delta
+from utils.records import Product, ProductColumns
+
+class TestIncremental(TestCase):
+
+    def setUp(self):
+        self.index_dir = tempfile.mkdtemp()
+        self.index_path = os.path.join(self.index_dir, "fingerprints.json")
+        self.records = [
+            {'Title': 'T-shirt 2', 'Price': '$102.15', 'Rating': 'Rating: ⭐ 3.9 / 5', 'Colors': '3 Colors', 'Size': 'Size: M', 'Gender': 'Gender: Women', 'timestamp': '2025-11-14T19:37:27'},
+            {'Title': 'Hoodie 3', 'Price': '$496.88', 'Rating': 'Rating: ⭐ 4.8 / 5', 'Colors': '3 Colors', 'Size': 'Size: L', 'Gender': 'Gender: Unisex', 'timestamp': '2025-11-14T19:37:27'},
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.index_dir, ignore_errors=True)
+
+    def test_fingerprint_ignores_timestamp(self):
+        later = dict(self.records[0], timestamp='2025-11-15T08:00:00')
+        self.assertEqual(fingerprint(self.records[0]), fingerprint(later))
+
+    def test_diff_detects_new_changed_and_removed(self):
+        index = FingerprintIndex(self.index_path)
+        first = index.diff(self.records)
+        self.assertEqual(len(first.new), 2)
+        index.commit(first)
+
+        index = FingerprintIndex(self.index_path)
+        current = [
+            dict(self.records[0], Price='$99.99', timestamp='later'),
+            {'Title': 'Pants 4', 'Price': '$467.31', 'Rating': 'Rating: ⭐ 3.3 / 5', 'Colors': '1 Colors', 'Size': 'Size: XL', 'Gender': 'Gender: Men', 'timestamp': 'later'},
+        ]
+        changes = index.diff(current)
+
+        self.assertEqual([r['Title'] for r in changes.new], ['Pants 4'])
+        self.assertEqual([r['Title'] for r in changes.changed], ['T-shirt 2'])
+        self.assertEqual(changes.removed, ['Hoodie 3'])
+
+    def test_unchanged_run_is_empty(self):
+        index = FingerprintIndex(self.index_path)
+        index.commit(index.diff(self.records))
+
+        changes = FingerprintIndex(self.index_path).diff([dict(r, timestamp='later') for r in self.records])
+
+        self.assertFalse(changes)
+
+    def test_merge_delta(self):
+        base = pd.DataFrame({'Title': ['A', 'B', 'C'], 'Price': [1.0, 2.0, 3.0]})
+        delta = pd.DataFrame({'Title': ['B', 'D'], 'Price': [20.0, 4.0]})
+
+        merged = merge_delta(base, delta, removed=['C'])
+
+        self.assertEqual(merged.to_dict('records'), [
+            {'Title': 'A', 'Price': 1.0}, {'Title': 'B', 'Price': 20.0}, {'Title': 'D', 'Price': 4.0}
+        ])
+
+    def test_merge_delta_into_empty_base(self):
+        base = pd.DataFrame(columns=['Title', 'Price'])
+        delta = pd.DataFrame({'Title': ['A'], 'Price': [1.0]})
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            merged = merge_delta(base, delta, removed=[])
+
+        self.assertEqual(merged.to_dict('records'), [{'Title': 'A', 'Price': 1.0}])
+
+    def test_partial_crawl_keeps_missing_keys(self):
+        index = FingerprintIndex(self.index_path)
+        index.commit(index.diff(self.records))
+
+        changes = FingerprintIndex(self.index_path).diff(self.records[:1], complete=False)
+
+        self.assertEqual(changes.removed, [])
+        self.assertEqual(set(changes.fingerprints), {'T-shirt 2', 'Hoodie 3'})
+
+class TestIncrementalPipeline(TestCase):
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.workdir = tempfile.mkdtemp()
+        os.chdir(self.workdir)
+        self.products = [
+            Product(f'Shirt {i}', f'${10 + i}.00', 'Rating: ⭐ 4.0 / 5', '3 Colors', 'Size: M', 'Gender: Men', '2025-11-14T19:37:27')
+            for i in range(3)
+        ]
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def run_main(self, products, failed_pages=(), **scrape_options):
+        columns = ProductColumns()
+        columns.extend(products)
+        columns.failed_pages.extend(failed_pages)
+        with patch.object(main.SINKS, 'factories', {'csv': main.csv_sink}), \
+                patch('main.scrape_product_columns', return_value=columns):
+            main.main(incremental=True, scrape_options=scrape_options)
+        return pd.read_csv(main.CSV_FILENAME)
+
+    def test_partial_page_range_does_not_delete(self):
+        self.run_main(self.products)
+        saved = self.run_main(self.products[:1], start_page=2)
+
+        self.assertEqual(sorted(saved['Title']), ['Shirt 0', 'Shirt 1', 'Shirt 2'])
+        saved = self.run_main(self.products[:2])
+        self.assertEqual(sorted(saved['Title']), ['Shirt 0', 'Shirt 1'])
+
+    def test_failed_pages_keep_products_and_checkpoint(self):
+        self.run_main(self.products)
+        os.makedirs(os.path.dirname(main.CHECKPOINT_FILE), exist_ok=True)
+        open(main.CHECKPOINT_FILE, 'w').close()
+        saved = self.run_main(self.products[:1], failed_pages=[2])
+
+        self.assertEqual(sorted(saved['Title']), ['Shirt 0', 'Shirt 1', 'Shirt 2'])
+        self.assertTrue(os.path.exists(main.CHECKPOINT_FILE))
+
+    def test_product_turning_invalid_is_removed(self):
+        self.run_main(self.products)
+        unavailable = self.products[1]._replace(Price='Price Unavailable')
+        saved = self.run_main([self.products[0], unavailable, self.products[2]])
+
+        self.assertEqual(sorted(saved['Title']), ['Shirt 0', 'Shirt 2'])
+
+    def test_sharded_crawl_is_merged_before_loading(self):
+        with MockCatalogueServer(pages=4, cards_per_page=3) as server, \
+                patch.object(main.SINKS, 'factories', {'csv': main.csv_sink}):
+            main.main(incremental=True, scrape_options={'root_url': server.url, 'end_page': 4, 'shards': 2, 'workers': 2})
+            saved = pd.read_csv(main.CSV_FILENAME)
+
+        self.assertEqual(len(saved), 12)
+        self.assertFalse(os.path.exists(main.checkpoint_path(main.CHECKPOINT_FILE, 0, 2)))
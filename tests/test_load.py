@@ -1,16 +1,89 @@
 import pandas as pd
 import os
-from unittest import TestCase
+import re
+import shutil
+import tempfile
+from unittest import TestCase, skipIf
 from unittest.mock import patch, MagicMock
-from utils.load import load_to_csv, load_to_google_sheets, load_to_postgresql
+from httplib2 import Response
+from googleapiclient.errors import HttpError
+
+try:
+    import pyarrow.dataset as pa_dataset
+except ImportError:
+    pa_dataset = None
+from utils.load import load_to_csv, load_to_parquet
+from utils.sheets import load_to_google_sheets, sync_to_google_sheets, reset_sheets_services
+from utils.postgres import (
+    load_to_postgresql, load_to_postgresql_upsert, copy_method, load_tables_to_postgresql, get_engine, dispose_engines
+)
+
+class FakeRequest:
+
+    def __init__(self, fn):
+        self.fn = fn
+
+    def execute(self):
+        return self.fn()
+
+class FakeSheetsService:
+
+    def __init__(self, values=None, throttle=0):
+        self.grid = [list(row) for row in (values or [])]
+        self.throttle = throttle
+        self.calls = []
+
+    def spreadsheets(self):
+        return self
+
+    def values(self):
+        return self
+
+    def _row(self, a1):
+        return int(re.match(r".*![A-Z]+(\d+)", a1).group(1))
+
+    def get(self, spreadsheetId, range, valueRenderOption=None):
+        self.calls.append('get')
+        return FakeRequest(lambda: {'values': [list(row) for row in self.grid]})
+
+    def batchUpdate(self, spreadsheetId, body):
+        def run():
+            if self.throttle:
+                self.throttle -= 1
+                raise HttpError(Response({'status': 429}), b'Too Many Requests')
+            self.calls.append('batchUpdate')
+            for item in body['data']:
+                start = self._row(item['range'])
+                for offset, row in enumerate(item['values']):
+                    while len(self.grid) < start + offset:
+                        self.grid.append([])
+                    self.grid[start + offset - 1] = list(row)
+            return {}
+        return FakeRequest(run)
+
+    def batchClear(self, spreadsheetId, body):
+        def run():
+            self.calls.append('batchClear')
+            for a1 in body['ranges']:
+                start, end = (int(n) for n in re.findall(r"[A-Z]+(\d+)", a1.split('!')[1]))
+                for row_number in range(start, end + 1):
+                    self.grid[row_number - 1] = []
+            while self.grid and not self.grid[-1]:
+                self.grid.pop()
+            return {}
+        return FakeRequest(run)
 
 class TestLoad(TestCase):
 
     def setUp(self):
         self.dummy_df = pd.DataFrame({'col1': [1, 2], 'col2': ['A', 'B']})
         self.test_csv_file = "test_output_for_unittest.csv"
+        dispose_engines()
+        reset_sheets_services()
 
     def tearDown(self):
+        dispose_engines()
+        reset_sheets_services()
         if os.path.exists(self.test_csv_file):
             os.remove(self.test_csv_file)
 
@@ -21,15 +94,54 @@ class TestLoad(TestCase):
         read_df = pd.read_csv(self.test_csv_file)
         pd.testing.assert_frame_equal(read_df, self.dummy_df)
 
+    def test_load_to_csv_chunks(self):
+        chunks = iter([self.dummy_df.iloc[:1], self.dummy_df.iloc[1:]])
+
+        load_to_csv(chunks, self.test_csv_file)
+
+        read_df = pd.read_csv(self.test_csv_file)
+        pd.testing.assert_frame_equal(read_df, self.dummy_df)
+
+    @skipIf(pa_dataset is None, "pyarrow belum terinstall")
+    def test_load_to_parquet_appends_partitioned_snapshots(self):
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root, True)
+        df = pd.DataFrame({
+            'Title': ['T-shirt 2', 'Hoodie 3'],
+            'Price': [1634400.0, 7950080.0],
+            'Colors': [3, 3],
+            'Gender': ['Women', 'Unisex'],
+            'timestamp': ['2025-11-14T19:37:27.095822'] * 2,
+        })
+
+        self.assertTrue(load_to_parquet(df, root))
+        self.assertTrue(load_to_parquet(df, root))
+
+        self.assertTrue(os.path.isdir(os.path.join(root, 'scrape_date=2025-11-14', 'Gender=Women')))
+        table = pa_dataset.dataset(root, format="parquet", partitioning="hive").to_table(
+            filter=pa_dataset.field('Gender') == 'Women'
+        )
+        self.assertEqual(table.num_rows, 2)
+        self.assertEqual(str(table.schema.field('Colors').type), 'int64')
+
+    def test_load_to_csv_applies_delta(self):
+        load_to_csv(self.dummy_df, self.test_csv_file)
+
+        delta = pd.DataFrame({'col1': [3], 'col2': ['C']})
+        load_to_csv(delta, self.test_csv_file, removed=[1], key_column='col1')
+
+        read_df = pd.read_csv(self.test_csv_file)
+        self.assertEqual(read_df['col1'].tolist(), [2, 3])
+
     @patch('pandas.DataFrame.to_csv')
     def test_load_to_csv_permission_error(self, mock_to_csv):
         mock_to_csv.side_effect = PermissionError("Mocked Permission Error")
         load_to_csv(self.dummy_df, self.test_csv_file)
         self.assertFalse(os.path.exists(self.test_csv_file))
 
-    @patch('utils.load.Credentials')
-    @patch('utils.load.build')
-    @patch('utils.load.os.path.exists')
+    @patch('utils.sheets.Credentials')
+    @patch('utils.sheets.build')
+    @patch('utils.sheets.os.path.exists')
     def test_load_to_google_sheets_success(self, mock_exists, mock_build, mock_credentials):
         mock_exists.return_value = True 
         
@@ -43,28 +155,160 @@ class TestLoad(TestCase):
         mock_service.spreadsheets().values().clear().execute.assert_called_once()
         mock_service.spreadsheets().values().update().execute.assert_called_once()
 
-    @patch('utils.load.os.path.exists')
+    @patch('utils.sheets.os.path.exists')
     def test_load_to_google_sheets_no_creds(self, mock_exists):
         mock_exists.return_value = False 
         load_to_google_sheets(self.dummy_df, "DUMMY_ID", "dummy_path.json")
 
     @patch('pandas.DataFrame.to_sql')
-    @patch('utils.load.create_engine')
+    @patch('utils.postgres.create_engine')
     def test_load_to_postgresql_success(self, mock_create_engine, mock_to_sql):
         mock_engine = MagicMock()
         mock_create_engine.return_value = mock_engine
 
         load_to_postgresql(self.dummy_df, "DUMMY_DB_URL", "dummy_table")
 
-        mock_create_engine.assert_called_with("DUMMY_DB_URL")
+        self.assertEqual(mock_create_engine.call_args[0][0], "DUMMY_DB_URL")
         mock_to_sql.assert_called_with(
             "dummy_table", 
             mock_engine, 
             if_exists='replace', 
-            index=False
+            index=False,
+            method=None
         )
 
-    @patch('utils.load.create_engine')
+    @patch('pandas.DataFrame.to_sql')
+    @patch('utils.postgres.create_engine')
+    def test_load_to_postgresql_chunks_append_after_first(self, mock_create_engine, mock_to_sql):
+        load_to_postgresql([self.dummy_df, self.dummy_df], "DUMMY_DB_URL", "dummy_table")
+
+        modes = [call.kwargs['if_exists'] for call in mock_to_sql.call_args_list]
+        self.assertEqual(modes, ['replace', 'append'])
+
+    @patch('utils.postgres.create_engine')
     def test_load_to_postgresql_exception(self, mock_create_engine):
         mock_create_engine.side_effect = Exception("Mocked DB Connection Error")
-        load_to_postgresql(self.dummy_df, "DUMMY_DB_URL", "dummy_table")
\ No newline at end of file
+        load_to_postgresql(self.dummy_df, "DUMMY_DB_URL", "dummy_table")
+
+    def test_copy_method_streams_rows_with_copy(self):
+        table = MagicMock(schema=None)
+        table.name = "dummy_table"
+        conn = MagicMock()
+        cursor = conn.connection.cursor.return_value.__enter__.return_value
+
+        copy_method(table, conn, ['col1', 'col2'], iter([(1, 'A'), (2, 'B')]))
+
+        sql, buffer = cursor.copy_expert.call_args[0]
+        self.assertEqual(sql, 'COPY "dummy_table" ("col1", "col2") FROM STDIN WITH (FORMAT csv)')
+        self.assertEqual(buffer.getvalue(), '1,A\r\n2,B\r\n')
+
+    @patch('utils.postgres.create_engine')
+    def test_load_to_postgresql_upsert_merges_from_staging(self, mock_create_engine):
+        conn = mock_create_engine.return_value.begin.return_value.__enter__.return_value
+        conn.execute.return_value.first.return_value = (1,)
+        cursor = conn.connection.cursor.return_value.__enter__.return_value
+
+        load_to_postgresql_upsert(self.dummy_df, "DUMMY_DB_URL", "dummy_table", key_columns=("col1",), index_columns=("col2",))
+
+        statements = [str(call.args[0]) for call in conn.execute.call_args_list]
+        self.assertIn('PRIMARY KEY ("col1")', statements[0])
+        self.assertTrue(any('CREATE INDEX IF NOT EXISTS "dummy_table_col2_idx"' in sql for sql in statements))
+        self.assertIn('COPY "dummy_table_staging"', cursor.copy_expert.call_args[0][0])
+        self.assertIn('ON CONFLICT ("col1") DO UPDATE SET "col2" = EXCLUDED."col2"', statements[-1])
+
+    @patch('utils.postgres.create_engine')
+    def test_get_engine_reuses_pool_per_url(self, mock_create_engine):
+        first = get_engine("postgresql+psycopg2://u@h/db", pool_size=3)
+        second = get_engine("postgresql+psycopg2://u@h/db")
+
+        self.assertIs(first, second)
+        mock_create_engine.assert_called_once_with(
+            "postgresql+psycopg2://u@h/db", pool_pre_ping=True, pool_size=3, max_overflow=5, pool_recycle=1800
+        )
+
+        dispose_engines()
+        first.dispose.assert_called_once()
+        get_engine("postgresql+psycopg2://u@h/db")
+        self.assertEqual(mock_create_engine.call_count, 2)
+
+    @patch('utils.postgres.create_engine')
+    def test_load_tables_to_postgresql_single_transaction(self, mock_create_engine):
+        engine = mock_create_engine.return_value
+        conn = engine.begin.return_value.__enter__.return_value
+        conn.execute.return_value.first.return_value = (1,)
+
+        ok = load_tables_to_postgresql({"table_a": self.dummy_df, "table_b": self.dummy_df}, "DUMMY_DB_URL", key_columns=("col1",))
+
+        self.assertTrue(ok)
+        engine.begin.assert_called_once()
+        statements = [str(call.args[0]) for call in conn.execute.call_args_list]
+        self.assertTrue(any('INSERT INTO "table_a"' in sql for sql in statements))
+        self.assertTrue(any('INSERT INTO "table_b"' in sql for sql in statements))
+
+    def test_sync_to_google_sheets_writes_only_changed_rows(self):
+        service = FakeSheetsService([['col1', 'col2'], ['A', 1], ['B', 2], ['C', 3]])
+        df = pd.DataFrame({'col1': ['A', 'C', 'D'], 'col2': [1, 30, 4]})
+
+        sync_to_google_sheets(df, "DUMMY_ID", key_column='col1', service=service)
+
+        self.assertEqual(sorted(service.grid[1:]), [['A', 1], ['C', 30], ['D', 4]])
+        self.assertEqual(service.grid[0], ['col1', 'col2'])
+        self.assertEqual(service.grid[1], ['A', 1])
+
+    def test_sync_to_google_sheets_applies_delta(self):
+        service = FakeSheetsService([['col1', 'col2'], ['A', 1], ['B', 2], ['C', 3]])
+        delta = pd.DataFrame({'col1': ['B', 'D'], 'col2': [20, 4]})
+
+        sync_to_google_sheets(delta, "DUMMY_ID", key_column='col1', service=service, removed=['A'])
+
+        self.assertEqual(sorted(service.grid[1:]), [['B', 20], ['C', 3], ['D', 4]])
+
+    def test_sync_to_google_sheets_packs_scattered_rows_into_one_request(self):
+        rows = [[f'P{i}', i, '2025-11-14'] for i in range(800)]
+        service = FakeSheetsService([['Title', 'Price', 'timestamp']] + rows)
+        df = pd.DataFrame(
+            [[title, price + 1 if price % 2 else price, '2025-11-15'] for title, price, _ in rows],
+            columns=['Title', 'Price', 'timestamp'],
+        )
+
+        sync_to_google_sheets(df, "DUMMY_ID", service=service)
+
+        self.assertEqual(service.calls, ['get', 'batchUpdate'])
+        self.assertEqual(service.grid[2], ['P1', 2, '2025-11-15'])
+        self.assertEqual(service.grid[1], ['P0', 0, '2025-11-14'])
+
+    def test_sync_to_google_sheets_ignores_timestamp_only_changes(self):
+        service = FakeSheetsService([['Title', 'timestamp'], ['A', '2025-11-14'], ['B', '2025-11-14']])
+        df = pd.DataFrame({'Title': ['A', 'B'], 'timestamp': ['2025-11-15', '2025-11-15']})
+
+        sync_to_google_sheets(df, "DUMMY_ID", service=service)
+
+        self.assertEqual(service.calls, ['get'])
+
+    def test_sync_to_google_sheets_noop_when_unchanged(self):
+        service = FakeSheetsService([['col1', 'col2'], [1, 'A'], [2, 'B']])
+
+        sync_to_google_sheets(self.dummy_df, "DUMMY_ID", key_column='col1', service=service)
+
+        self.assertEqual(service.calls, ['get'])
+
+    @patch('utils.sheets.time.sleep')
+    def test_sync_to_google_sheets_retries_on_429_and_chunks(self, mock_sleep):
+        service = FakeSheetsService(throttle=2)
+        df = pd.DataFrame({'col1': range(10), 'col2': ['x'] * 10})
+
+        sync_to_google_sheets(df, "DUMMY_ID", key_column='col1', service=service, max_cells=8)
+
+        self.assertEqual(mock_sleep.call_count, 2)
+        self.assertEqual(service.calls.count('batchUpdate'), 3)
+        self.assertEqual(service.grid, [['col1', 'col2']] + [[i, 'x'] for i in range(10)])
+
+    def test_sync_to_google_sheets_uses_local_snapshot(self):
+        snapshot = "test_sheet_snapshot.json"
+        self.addCleanup(lambda: os.path.exists(snapshot) and os.remove(snapshot))
+        service = FakeSheetsService()
+
+        sync_to_google_sheets(self.dummy_df, "DUMMY_ID", key_column='col1', service=service, snapshot_path=snapshot)
+        sync_to_google_sheets(self.dummy_df, "DUMMY_ID", key_column='col1', service=service, snapshot_path=snapshot)
+
+        self.assertEqual(service.calls, ['get', 'batchUpdate'])
@@ -0,0 +1,67 @@
+import json
+from unittest import TestCase
+from unittest.mock import patch
+from utils.metrics import Metrics
+
+class TestMetrics(TestCase):
+
+    def setUp(self):
+        self.metrics = Metrics()
+
+    def test_timer_and_counters(self):
+        with self.metrics.timer("extract"):
+            pass
+        with self.metrics.timer("extract"):
+            pass
+        self.metrics.incr("pages_fetched", 4)
+        self.metrics.incr("bytes_fetched", 2048)
+
+        snapshot = self.metrics.snapshot()
+
+        self.assertEqual(snapshot["timers"]["extract"]["count"], 2)
+        self.assertEqual(snapshot["counters"]["bytes_fetched"], 2048)
+        self.assertGreater(snapshot["rates"]["pages_per_second"], 0)
+
+    def test_timed_decorator_records_on_error(self):
+        @self.metrics.timed("transform")
+        def broken():
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError):
+            broken()
+
+        self.assertEqual(self.metrics.snapshot()["timers"]["transform"]["count"], 1)
+
+    def test_timed_iter_excludes_consumer_time(self):
+        def produce():
+            yield 1
+            yield 2
+
+        with patch('utils.metrics.time.perf_counter', side_effect=[0.0, 1.0, 5.0, 6.0, 9.0, 10.0]):
+            items = list(self.metrics.timed_iter("extract", produce()))
+
+        self.assertEqual(items, [1, 2])
+        self.assertEqual(self.metrics.timers["extract"]["count"], 3)
+        self.assertEqual(self.metrics.timers["extract"]["total"], 3.0)
+
+    def test_merge_adds_child_snapshot(self):
+        child = Metrics()
+        child.observe("parse", 0.5)
+        child.incr("pages_fetched", 3)
+        self.metrics.observe("parse", 0.25)
+
+        self.metrics.merge(child.snapshot())
+
+        self.assertEqual(self.metrics.timers["parse"], {"count": 2, "total": 0.75, "max": 0.5})
+        self.assertEqual(self.metrics.counters["pages_fetched"], 3)
+
+    def test_exports(self):
+        self.metrics.observe("load.csv", 0.25)
+        self.metrics.incr("rows_loaded", 10)
+
+        data = json.loads(self.metrics.to_json())
+        prometheus = self.metrics.to_prometheus()
+
+        self.assertEqual(data["timers"]["load.csv"]["total"], 0.25)
+        self.assertIn('etl_stage_seconds_total{stage="load.csv"} 0.250000', prometheus)
+        self.assertIn('etl_rows_loaded_total 10', prometheus)
@@ -0,0 +1,70 @@
+import time
+import pandas as pd
+from unittest import TestCase
+from utils.metrics import METRICS
+from utils.orchestrator import LoadOrchestrator, format_summary
+
+class TestOrchestrator(TestCase):
+
+    def setUp(self):
+        self.dummy_df = pd.DataFrame({'col1': [1, 2], 'col2': ['A', 'B']})
+
+    def test_sinks_run_concurrently(self):
+        orchestrator = LoadOrchestrator()
+        for name in ("a", "b", "c"):
+            orchestrator.register(name, lambda df: time.sleep(0.2))
+
+        start = time.perf_counter()
+        results = orchestrator.run(self.dummy_df)
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.5)
+        self.assertTrue(all(result.ok for result in results))
+        self.assertEqual([result.rows for result in results], [2, 2, 2])
+
+    def test_failures_are_isolated(self):
+        def broken(df):
+            raise RuntimeError("koneksi ditolak")
+
+        orchestrator = LoadOrchestrator()
+        orchestrator.register("broken", broken)
+        orchestrator.register("reported", lambda df: False)
+        orchestrator.register("good", lambda df: True)
+
+        results = {result.name: result for result in orchestrator.run(self.dummy_df)}
+
+        self.assertFalse(results["broken"].ok)
+        self.assertEqual(results["broken"].error, "koneksi ditolak")
+        self.assertFalse(results["reported"].ok)
+        self.assertTrue(results["good"].ok)
+
+    def test_per_sink_timeout(self):
+        orchestrator = LoadOrchestrator()
+        orchestrator.register("slow", lambda df: time.sleep(1), timeout=0.1)
+        orchestrator.register("fast", lambda df: None)
+
+        start = time.perf_counter()
+        results = {result.name: result for result in orchestrator.run(self.dummy_df)}
+
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertFalse(results["slow"].ok)
+        self.assertIn("timeout", results["slow"].error)
+        self.assertTrue(results["fast"].ok)
+        self.assertIn("slow", format_summary(results.values()))
+
+    def test_timed_out_sink_is_skipped_until_it_finishes(self):
+        METRICS.reset()
+        orchestrator = LoadOrchestrator()
+        orchestrator.register("slow", lambda df: time.sleep(0.5), timeout=0.05)
+        orchestrator.register("fast", lambda df: None)
+
+        orchestrator.run(self.dummy_df)
+        results = {result.name: result for result in orchestrator.run(self.dummy_df)}
+
+        self.assertIn("masih berjalan", results["slow"].error)
+        self.assertTrue(results["fast"].ok)
+        self.assertEqual(METRICS.counters["rows_loaded"], 4)
+
+        time.sleep(0.6)
+        results = {result.name: result for result in orchestrator.run(self.dummy_df)}
+        self.assertNotIn("masih berjalan", results["slow"].error or "")
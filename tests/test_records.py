@@ -0,0 +1,56 @@
+import pickle
+import unittest
+
+import pandas as pd
+
+from utils.parsers import SoupParser, build_product
+from utils.records import FIELDS, Product, ProductColumns, as_products
+from utils.transform import transform_data
+from benchmarks.mock_server import render_page
+
+class TestRecords(unittest.TestCase):
+
+    def setUp(self):
+        self.products = [
+            build_product('T-shirt 2', '$102.15', ['Rating: ⭐ 3.9 / 5', '3 Colors', 'Size: M', 'Gender: Women'], '2025-11-14T19:37:27'),
+            build_product('Hoodie 3', '$496.88', ['Rating: ⭐ 4.8 / 5', '3 Colors', 'Size: L', 'Gender: Unisex'], '2025-11-14T19:37:27'),
+        ]
+
+    def test_product_supports_key_access(self):
+        product = self.products[0]
+        self.assertEqual(product['Title'], 'T-shirt 2')
+        self.assertEqual(product.get('Size'), 'Size: M')
+        self.assertIsNone(product.get('missing'))
+        self.assertEqual(product[0], 'T-shirt 2')
+        self.assertEqual(pickle.loads(pickle.dumps(product)), product)
+
+    def test_product_behaves_like_the_old_dict(self):
+        product = self.products[0]
+        self.assertIn('timestamp', product)
+        self.assertNotIn('missing', product)
+        self.assertEqual(list(product.keys()), list(FIELDS))
+        self.assertEqual(dict(product)['Price'], '$102.15')
+
+    def test_page_shares_interned_strings(self):
+        products = SoupParser().parse(render_page(1, 3, 4))
+        self.assertEqual(len({id(product.timestamp) for product in products}), 1)
+
+        sizes = [build_product('A', '$1', [''.join(['Size: ', 'M'])])['Size'] for _ in range(2)]
+        self.assertIs(sizes[0], sizes[1])
+
+    def test_columns_build_same_frame_as_records(self):
+        columns = ProductColumns()
+        columns.extend(self.products)
+        columns.append(self.products[0]._asdict())
+
+        self.assertEqual(len(columns), 3)
+        self.assertEqual(list(columns)[1], self.products[1])
+        pd.testing.assert_frame_equal(columns.to_frame(), pd.DataFrame(self.products + self.products[:1]))
+        pd.testing.assert_frame_equal(transform_data(columns), transform_data(list(columns)))
+
+    def test_as_products_accepts_cached_rows(self):
+        rows = [list(self.products[0]), self.products[1]._asdict()]
+        self.assertEqual(as_products(rows), self.products)
+
+if __name__ == '__main__':
+    unittest.main()
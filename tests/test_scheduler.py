@@ -0,0 +1,211 @@
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+import main
+from benchmarks.mock_server import MockCatalogueServer
+from utils.orchestrator import SinkResult
+from utils.records import Product
+from utils.scheduler import PipelineDaemon, percentile
+from utils.transform import transform_data
+
+def make_page(page_number, size=3):
+    return [
+        Product(f'Shirt {page_number}-{i}', '$10.00', 'Rating: ⭐ 4.0 / 5', '3 Colors', 'Size: M', 'Gender: Men', '2025-11-14T19:37:27')
+        for i in range(size)
+    ]
+
+class TestPipelineDaemon(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.history_path = os.path.join(self.tmpdir, "runs.jsonl")
+        self.loaded = []
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def record_load(self, df, append):
+        self.loaded.append((len(df), append))
+        return [SinkResult("memory", True, 0.0, len(df))]
+
+    def make_daemon(self, extract, load=None, **options):
+        options.setdefault("history_path", self.history_path)
+        return PipelineDaemon(extract, lambda data: transform_data(data), load or self.record_load, **options)
+
+    def test_run_loads_chunks_and_records_history(self):
+        daemon = self.make_daemon(lambda: iter([make_page(1), make_page(2), make_page(3)]), chunk_size=4)
+        try:
+            record = asyncio.run(daemon.run_once())
+        finally:
+            daemon.close()
+
+        self.assertEqual(record.status, "ok")
+        self.assertEqual(record.rows, 9)
+        self.assertEqual(self.loaded, [(6, False), (3, True)])
+        self.assertEqual(set(record.stages), {"extract", "transform", "load"})
+        with open(self.history_path, encoding="utf-8") as f:
+            self.assertEqual(json.loads(f.readline())["rows"], 9)
+        self.assertEqual(self.make_daemon(lambda: iter([])).history[-1]["run_id"], 1)
+
+    def test_stages_overlap(self):
+        first_loaded = threading.Event()
+
+        def extract():
+            yield make_page(1)
+            # Only finishes if the first chunk reaches the load stage while extract is still running.
+            self.assertTrue(first_loaded.wait(timeout=5))
+            yield make_page(2)
+
+        def load(df, append):
+            first_loaded.set()
+            return self.record_load(df, append)
+
+        daemon = self.make_daemon(extract, load=load, chunk_size=3)
+        try:
+            record = asyncio.run(daemon.run_once())
+        finally:
+            daemon.close()
+
+        self.assertEqual(record.status, "ok")
+        self.assertEqual(self.loaded, [(3, False), (3, True)])
+
+    def test_overlapping_trigger_is_skipped(self):
+        def slow_load(df, append):
+            time.sleep(0.2)
+            return self.record_load(df, append)
+
+        daemon = self.make_daemon(lambda: iter([make_page(1)]), load=slow_load)
+
+        async def trigger_twice():
+            first = daemon.trigger()
+            await asyncio.sleep(0.05)
+            second = await daemon.run_once()
+            return await first, second
+
+        try:
+            first, second = asyncio.run(trigger_twice())
+        finally:
+            daemon.close()
+
+        self.assertEqual(first.status, "ok")
+        self.assertEqual(second.status, "skipped")
+        self.assertEqual(len(self.loaded), 1)
+        self.assertEqual(daemon.summary()["skipped"], 1)
+
+    def test_stage_error_fails_run_and_closes_extract(self):
+        closed = threading.Event()
+
+        def extract():
+            try:
+                for page_number in range(1, 100):
+                    yield make_page(page_number)
+            finally:
+                closed.set()
+
+        def broken_load(df, append):
+            raise RuntimeError("koneksi ditolak")
+
+        daemon = self.make_daemon(extract, load=broken_load, chunk_size=3, queue_size=1)
+        try:
+            record = asyncio.run(daemon.run_once())
+        finally:
+            daemon.close()
+
+        self.assertEqual(record.status, "failed")
+        self.assertEqual(record.error, "koneksi ditolak")
+        self.assertTrue(closed.is_set())
+
+    def test_failed_sink_marks_run_failed(self):
+        daemon = self.make_daemon(lambda: iter([make_page(1)]), load=lambda df, append: [SinkResult("csv", False, 0.0, 0, "x")])
+        try:
+            record = asyncio.run(daemon.run_once())
+        finally:
+            daemon.close()
+
+        self.assertEqual(record.status, "failed")
+        self.assertEqual(record.failed_sinks, ["csv"])
+
+    def test_serve_runs_on_schedule_and_reports_status(self):
+        daemon = self.make_daemon(lambda: iter([make_page(1)]), interval=0.05)
+
+        async def serve_and_query():
+            serving = asyncio.ensure_future(daemon.serve(max_runs=3, status_port=0))
+            while daemon.status_address is None:
+                await asyncio.sleep(0.01)
+            reader, writer = await asyncio.open_connection(*daemon.status_address)
+            writer.write(b"GET / HTTP/1.1\r\n\r\n")
+            response = await reader.read()
+            writer.close()
+            return await serving, response
+
+        summary, response = asyncio.run(serve_and_query())
+
+        self.assertEqual(summary["runs"], 3)
+        self.assertEqual(summary["ok"], 3)
+        self.assertIsNotNone(summary["latency"]["load"]["p95"])
+        self.assertTrue(response.startswith(b"HTTP/1.1 200 OK"))
+        self.assertIn("summary", json.loads(response.split(b"\r\n\r\n", 1)[1]))
+
+    def test_stop_finishes_current_run(self):
+        daemon = self.make_daemon(lambda: iter([make_page(1)]), interval=60)
+
+        async def serve_then_stop():
+            serving = asyncio.ensure_future(daemon.serve())
+            await asyncio.sleep(0.05)
+            daemon.stop()
+            return await asyncio.wait_for(serving, timeout=5)
+
+        summary = asyncio.run(serve_then_stop())
+
+        self.assertEqual(summary["runs"], 1)
+        self.assertEqual(len(self.loaded), 1)
+
+    def test_percentile(self):
+        self.assertIsNone(percentile([], 0.5))
+        self.assertEqual(percentile([3, 1, 2], 0.5), 2)
+        self.assertEqual(percentile(list(range(1, 101)), 0.95), 96)
+
+class TestMainDaemon(unittest.TestCase):
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.workdir = tempfile.mkdtemp()
+        os.chdir(self.workdir)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def test_daemon_reuses_one_fetcher_across_runs(self):
+        with MockCatalogueServer(pages=3, cards_per_page=4) as server, \
+                patch.object(main.SINKS, 'factories', {'csv': main.csv_sink}), \
+                patch('main.Fetcher', wraps=main.Fetcher) as fetcher_class:
+            summary = main.main_daemon(interval=0.01, max_runs=2, chunk_size=5,
+                                       scrape_options={'root_url': server.url, 'end_page': 3, 'workers': 2})
+
+        self.assertEqual(summary["runs"], 2)
+        self.assertEqual(summary["ok"], 2)
+        self.assertEqual(fetcher_class.call_count, 1)
+        self.assertEqual(len(pd.read_csv(main.CSV_FILENAME)), 12)
+        with open(main.RUN_HISTORY_FILE, encoding="utf-8") as f:
+            statuses = [json.loads(line)["status"] for line in f]
+        self.assertEqual(statuses.count("ok"), 2)
+
+    def test_parse_args_daemon_flags(self):
+        args = main.parse_args(["--daemon", "--interval", "60", "--max-runs", "3", "--status-port", "8080"])
+        self.assertTrue(args.daemon)
+        self.assertEqual((args.interval, args.max_runs, args.status_port), (60, 3, 8080))
+        with self.assertRaises(SystemExit):
+            main.parse_args(["--daemon", "--interval", "0"])
+
+if __name__ == '__main__':
+    unittest.main()
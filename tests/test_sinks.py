@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from utils.sinks import SinkRegistry
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ("sqlalchemy", "google.oauth2", "googleapiclient", "pyarrow.dataset")
+
+def imported_modules(statement: str) -> set:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+def heavy(modules: set) -> list:
+    return sorted(name for name in modules if name.startswith(HEAVY_MODULES))
+
+class TestSinkRegistry(unittest.TestCase):
+
+    def test_create_calls_registered_factory(self):
+        registry = SinkRegistry()
+
+        @registry.register("null")
+        def null_sink(append=False, stream=False, removed=None):
+            return lambda df: append
+
+        self.assertEqual(registry.names(), ["null"])
+        self.assertTrue(registry.create("null", append=True)(None))
+        with self.assertRaises(ValueError):
+            registry.create("missing")
+
+    def test_build_orchestrator_uses_selected_sinks(self):
+        import main
+
+        orchestrator = main.build_orchestrator(sinks=["csv", "parquet"])
+        self.assertEqual(list(orchestrator.sinks), ["csv", "parquet"])
+        with self.assertRaises(SystemExit):
+            main.parse_args(["--sinks", "csv,missing"])
+        self.assertEqual(main.parse_args(["--sinks", "csv, parquet"]).sinks, ["csv", "parquet"])
+
+class TestImportTime(unittest.TestCase):
+
+    def test_startup_does_not_import_backends(self):
+        self.assertEqual(heavy(imported_modules("import main")), [])
+        self.assertEqual(heavy(imported_modules("import utils.load")), [])
+
+    def test_backends_load_only_when_selected(self):
+        modules = imported_modules("import main; main.build_orchestrator(sinks=['csv', 'postgresql'])")
+        self.assertIn("sqlalchemy", modules)
+        self.assertFalse([name for name in modules if name.startswith("googleapiclient")])
+
+if __name__ == '__main__':
+    unittest.main()
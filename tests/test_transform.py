@@ -1,7 +1,12 @@
 import pandas as pd
 import numpy as np
-from unittest import TestCase
-from utils.transform import transform_data
+from unittest import TestCase, skipIf
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+from utils.transform import transform_data, transform_data_fast, transform_chunks
 
 class TestTransform(TestCase):
 
@@ -52,4 +57,38 @@ class TestTransform(TestCase):
 
     def test_transform_data_exception(self):
         cleaned_df = transform_data(None)
-        self.assertTrue(cleaned_df.empty)
\ No newline at end of file
+        self.assertTrue(cleaned_df.empty)
+
+    def test_transform_chunks_batches_pages(self):
+        valid_row = self.dummy_dirty_data[0]
+        pages = [[dict(valid_row, Title=f'T-shirt {page}-{i}') for i in range(3)] for page in range(3)]
+
+        chunks = list(transform_chunks(iter(pages), chunk_size=4))
+
+        self.assertEqual([len(chunk) for chunk in chunks], [6, 3])
+        self.assertEqual(chunks[0]['Colors'].dtype, 'int64')
+
+    def test_transform_data_fast_matches_transform_data(self):
+        data = [dict(row, timestamp='2025-11-14T19:37:27.095822') for row in self.dummy_dirty_data]
+
+        expected = transform_data(data)
+        actual = transform_data_fast(data)
+
+        self.assertEqual(actual['Size'].dtype, 'category')
+        self.assertEqual(actual['Gender'].dtype, 'category')
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(actual['timestamp']))
+
+        actual = actual.astype({'Size': 'object', 'Gender': 'object'})
+        actual['timestamp'] = actual['timestamp'].dt.strftime('%Y-%m-%dT%H:%M:%S.%f')
+        pd.testing.assert_frame_equal(actual, expected)
+
+    def test_transform_data_fast_invalid_input(self):
+        self.assertTrue(transform_data_fast(None).empty)
+
+    @skipIf(pyarrow is None, "pyarrow belum terinstall")
+    def test_transform_data_fast_pyarrow_backend(self):
+        cleaned_df = transform_data_fast(self.dummy_dirty_data, dtype_backend="pyarrow")
+
+        self.assertEqual(len(cleaned_df), 2)
+        self.assertEqual(str(cleaned_df['Price'].dtype), 'double[pyarrow]')
+        self.assertEqual(cleaned_df['Price'].iloc[0], 1634400.0)
@@ -0,0 +1,69 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import pandas as pd
+
+from utils.load import load_to_quarantine
+from utils.transform import transform_data
+from utils.validate import REASONS, validate_products
+
+def row(**overrides):
+    base = {'Title': 'T-shirt 2', 'Price': '$102.15', 'Rating': 'Rating: ⭐ 3.9 / 5', 'Colors': '3 Colors',
+            'Size': 'Size: M', 'Gender': 'Gender: Women', 'timestamp': '2025-11-14T19:37:27'}
+    return dict(base, **overrides)
+
+class TestValidate(unittest.TestCase):
+
+    def test_rejected_rows_carry_reason_codes(self):
+        data = [
+            row(),
+            row(),
+            row(Title='Unknown Product'),
+            row(Title='A', Price='Price Unavailable'),
+            row(Title='B', Price='$0.00'),
+            row(Title='C', Rating='Rating: Not Rated'),
+            row(Title='D', Rating='Rating: ⭐ 7.5 / 5'),
+            row(Title='E', Size='Size: Huge', Gender='Gender: Robot'),
+            row(Title='F', Colors=None),
+            row(Title='G', Price='free'),
+        ]
+
+        result = validate_products(data)
+
+        self.assertEqual(result.valid['Title'].tolist(), ['T-shirt 2'])
+        self.assertEqual(result.rejected['reason'].tolist(), [
+            'duplicate', 'unknown_title', 'price_unavailable', 'price_out_of_range', 'not_rated',
+            'rating_out_of_range', 'unknown_size;unknown_gender', 'missing_value', 'invalid_price',
+        ])
+        self.assertEqual(len(result.valid) + len(result.rejected), len(data))
+
+    def test_reason_codes_are_known(self):
+        result = validate_products([row(Size=None, Rating='???'), {'Title': 'only title'}])
+        codes = {code for reason in result.rejected['reason'] for code in reason.split(';')}
+        self.assertTrue(codes <= set(REASONS))
+        self.assertTrue(result.valid.empty)
+
+    def test_bad_rows_do_not_discard_good_rows(self):
+        data = [row(Title=f'T-shirt {i}') for i in range(5)] + [row(Title='X', Price=['not', 'a', 'price'])]
+        self.assertEqual(len(transform_data(data)), 5)
+        self.assertEqual(validate_products(data).rejected['reason'].tolist(), ['invalid_type'])
+
+    def test_transform_data_sends_rejected_rows_to_quarantine(self):
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'quarantine', 'rejected.csv')
+            quarantine = lambda rejected: load_to_quarantine(rejected, path)
+
+            transform_data([row(), row(Title='Unknown Product')], quarantine=quarantine)
+            transform_data([row(Title='A', Price='Price Unavailable')], quarantine=quarantine)
+
+            saved = pd.read_csv(path)
+            self.assertEqual(saved['reason'].tolist(), ['unknown_title', 'price_unavailable'])
+            self.assertIn('quarantined_at', saved.columns)
+        finally:
+            shutil.rmtree(tmpdir)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+def content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+class HttpCache:
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, directory: str = ".cache/http", max_bytes: int = 50 * 1024 * 1024, ttl: float = 3600):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self._index = self._load_index()
+
+    def _load_index(self) -> dict:
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        try:
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self):
+        path = os.path.join(self.directory, self.INDEX_FILE)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_path, path)
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, key + suffix)
+
+    def _remove_files(self, key: str, suffixes=(".body", ".products.json")):
+        for suffix in suffixes:
+            try:
+                os.remove(self._path(key, suffix))
+            except FileNotFoundError:
+                pass
+
+    def _evict(self):
+        total = sum(entry["size"] for entry in self._index.values())
+        for key, entry in sorted(self._index.items(), key=lambda item: item[1]["last_access"]):
+            if total <= self.max_bytes:
+                break
+            total -= entry["size"]
+            del self._index[key]
+            self._remove_files(key)
+
+    def lookup(self, url: str):
+        with self._lock:
+            entry = self._index.get(self._key(url))
+            return dict(entry) if entry else None
+
+    def is_fresh(self, entry: dict) -> bool:
+        return time.time() - entry["stored_at"] < self.ttl
+
+    def conditional_headers(self, entry: dict) -> dict:
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def read_body(self, url: str):
+        key = self._key(url)
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return None
+            try:
+                with open(self._path(key, ".body"), "rb") as f:
+                    body = f.read()
+            except OSError:
+                del self._index[key]
+                return None
+            entry["last_access"] = time.time()
+            return body
+
+    def store(self, url: str, content: bytes, headers) -> dict:
+        key = self._key(url)
+        now = time.time()
+        entry = {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "hash": content_hash(content),
+            "size": len(content),
+            "stored_at": now,
+            "last_access": now,
+        }
+        with self._lock:
+            previous = self._index.get(key)
+            with open(self._path(key, ".body"), "wb") as f:
+                f.write(content)
+            if previous and previous["hash"] == entry["hash"]:
+                entry["products"] = previous.get("products", False)
+            else:
+                self._remove_files(key, (".products.json",))
+            self._index[key] = entry
+            self._evict()
+            self._save_index()
+        return entry
+
+    def revalidate(self, url: str):
+        key = self._key(url)
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is None:
+                return
+            entry["stored_at"] = entry["last_access"] = time.time()
+            self._save_index()
+
+    def load_products(self, url: str, digest: str):
+        key = self._key(url)
+        with self._lock:
+            entry = self._index.get(key)
+            if not entry or entry["hash"] != digest or not entry.get("products"):
+                return None
+            try:
+                with open(self._path(key, ".products.json"), encoding="utf-8") as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                entry["products"] = False
+                return None
+
+    def store_products(self, url: str, digest: str, products: list):
+        key = self._key(url)
+        with self._lock:
+            entry = self._index.get(key)
+            if not entry or entry["hash"] != digest:
+                return
+            with open(self._path(key, ".products.json"), "w", encoding="utf-8") as f:
+                json.dump(products, f)
+            entry["products"] = True
+            self._save_index()
+
+    def flush(self):
+        with self._lock:
+            self._save_index()
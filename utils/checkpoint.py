@@ -0,0 +1,97 @@
+import json
+import os
+from utils.records import as_products
+
+def checkpoint_path(path: str, shard_index: int = 0, shard_count: int = 1) -> str:
+    if shard_count <= 1:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.shard{shard_index}-of-{shard_count}{ext}"
+
+class CrawlCheckpoint:
+
+    def __init__(self, path: str, resume: bool = False, scope: dict = None, flush_every: int = 1):
+        self.path = path
+        self.scope = scope or {}
+        self.flush_every = max(flush_every, 1)
+        self.pages = {}
+        self._pending = []
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        valid_bytes = self._load() if resume else 0
+        if valid_bytes:
+            self._file = open(path, "r+b")
+            self._file.truncate(valid_bytes)
+            self._file.seek(valid_bytes)
+        else:
+            self.pages = {}
+            self._file = open(path, "wb")
+            self._write({"scope": self.scope})
+            self.flush()
+
+    def _load(self) -> int:
+        try:
+            with open(self.path, "rb") as f:
+                lines = f.readlines()
+        except OSError:
+            return 0
+
+        valid_bytes = 0
+        for number, line in enumerate(lines):
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break
+            if not line.endswith(b"\n"):
+                break
+            if number == 0:
+                if entry.get("scope") != self.scope:
+                    print(f"Checkpoint {self.path} berasal dari crawl lain. Memulai dari awal.")
+                    return 0
+            else:
+                self.pages[entry["page"]] = as_products(entry["products"])
+            valid_bytes += len(line)
+        return valid_bytes
+
+    @property
+    def last_page(self):
+        empty = [page_number for page_number, products in self.pages.items() if not products]
+        return min(empty) - 1 if empty else None
+
+    def _write(self, entry: dict):
+        self._pending.append(json.dumps(entry, ensure_ascii=False).encode("utf-8") + b"\n")
+
+    def record(self, page_number: int, products: list):
+        self.pages[page_number] = products
+        self._write({"page": page_number, "products": products})
+        if len(self._pending) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        if not self._pending:
+            return
+        self._file.write(b"".join(self._pending))
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = []
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def discard(self):
+        self.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -1,7 +1,17 @@
+import re
 import time
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, ProcessPoolExecutor
 import requests
-from bs4 import BeautifulSoup
-from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from utils.cache import content_hash
+from utils.checkpoint import CrawlCheckpoint, checkpoint_path
+from utils.metrics import METRICS
+from utils.parsers import extract_product_data, get_parser, page_timestamp, DEFAULT_PARSER
+from utils.records import ProductColumns, as_products
  
 HEADERS = {
     "User-Agent": (
@@ -9,99 +19,373 @@ HEADERS = {
         "(KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36"
     )
 }
- 
-def fetching_content(url):
-    session = requests.Session()
-    try:
-        response = session.get(url, headers=HEADERS)
+
+ROOT_URL = "https://fashion-studio.dicoding.dev"
+MAX_PAGE = 50
+
+class RateLimiter:
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+class Fetcher:
+
+    RETRY_STATUS = (429, 500, 502, 503, 504)
+
+    def __init__(self, pool_size=10, timeout=10, retries=3, backoff_factor=0.5, cache=None):
+        self.timeout = timeout
+        self.cache = cache
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Accept-Encoding": ACCEPT_ENCODING,
+            "Connection": "keep-alive",
+        })
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=self.RETRY_STATUS,
+            allowed_methods=frozenset(["GET"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url, headers=None):
+        response = self.session.get(url, headers={**HEADERS, **(headers or {})}, timeout=self.timeout)
         response.raise_for_status()
+        return response
+
+    def fetch(self, url):
+        if self.cache is None:
+            return self.get(url).content
+
+        entry = self.cache.lookup(url)
+        if entry and self.cache.is_fresh(entry):
+            body = self.cache.read_body(url)
+            if body is not None:
+                return body
+
+        headers = self.cache.conditional_headers(entry) if entry else None
+        response = self.get(url, headers=headers)
+        if response.status_code == 304 and entry:
+            body = self.cache.read_body(url)
+            if body is not None:
+                self.cache.revalidate(url)
+                return body
+            response = self.get(url)
+
+        self.cache.store(url, response.content, response.headers)
         return response.content
+
+    def close(self):
+        self.session.close()
+        if self.cache is not None:
+            self.cache.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+ 
+def fetching_content(url, fetcher=None):
+    owns_fetcher = fetcher is None
+    if owns_fetcher:
+        fetcher = Fetcher(pool_size=1)
+    try:
+        with METRICS.timer("fetch"):
+            content = fetcher.fetch(url)
+        METRICS.incr("pages_fetched")
+        METRICS.incr("bytes_fetched", len(content))
+        return content
     except requests.exceptions.RequestException as e:
+        METRICS.incr("fetch_errors")
         print(f"Terjadi kesalahan ketika melakukan requests terhadap {url}: {e}")
         return None
+    finally:
+        if owns_fetcher:
+            fetcher.close()
  
-def extract_product_data(card):
- 
-    details = card.find('div', class_='product-details')
-    if not details:
+PAGE_LINK_PATTERN = re.compile(rb'href=["\'][^"\']*/page(\d+)/?["\']')
+
+def page_url(page_number, root_url=None):
+    root_url = (root_url or ROOT_URL).rstrip("/")
+    if page_number == 1:
+        return root_url + "/"
+    return f"{root_url}/page{page_number}"
+
+def discover_page_count(fetcher=None, root_url=None):
+    content = fetching_content(page_url(1, root_url), fetcher=fetcher)
+    if not content:
         return None
- 
-    title_element = details.find('h3', class_='product-title')
-    title = title_element.text.strip() if title_element else None
- 
-    price_container = card.find('div', class_='price-container')
-    price_span = price_container.find('span', class_='price') if price_container else None
-    
-    if not price_span:
-        price_p = card.find('p', class_='price')
-        price = price_p.text.strip() if price_p else None
-    else:
-        price = price_span.text.strip() if price_span else None
-
-    p_tags = details.find_all('p')
-    rating, colors, size, gender = None, None, None, None
- 
-    for p in p_tags:
-        text = p.text.strip()
-        if text.startswith("Rating:"):
-            rating = text
-        elif text.endswith("Colors") or text.endswith("Colors:"):
-            colors = text
-        elif text.startswith("Size:"):
-            size = text
-        elif text.startswith("Gender:"):
-            gender = text
-            
-    timestamp = datetime.now().isoformat()
- 
-    product = {
-        "Title": title,
-        "Price": price,
-        "Rating": rating,
-        "Colors": colors,
-        "Size": size,
-        "Gender": gender,
-        "timestamp": timestamp
-    }
-    return product
- 
-def scrape_products(delay=1):
- 
-    ROOT_URL = "https://fashion-studio.dicoding.dev"
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    numbers = [int(n) for n in PAGE_LINK_PATTERN.findall(content)]
+    return max(numbers) if numbers else None
 
-    data = []
-    
-    for page_number in range(1, 51):
-        
-        if page_number == 1:
-            url = ROOT_URL + "/"
-        else:
-            url = f"{ROOT_URL}/page{page_number}"
-            
+def shard_pages(start_page, end_page, shard_index=0, shard_count=1):
+    if not 0 <= shard_index < shard_count:
+        raise ValueError(f"shard_index harus di antara 0 dan {shard_count - 1}")
+    return range(start_page + shard_index, end_page + 1, shard_count)
+
+def _timed_parse(content, parser=DEFAULT_PARSER):
+    start = time.perf_counter()
+    products = get_parser(parser).parse(content)
+    return products, time.perf_counter() - start
+
+def _record_parse(products, seconds):
+    METRICS.observe("parse", seconds)
+    METRICS.incr("products_parsed", len(products))
+
+def parse_page(content, parser=DEFAULT_PARSER):
+    products, seconds = _timed_parse(content, parser)
+    _record_parse(products, seconds)
+    return products
+
+def iter_page_contents(pages, fetcher=None, workers=1, limiter=None, root_url=None):
+
+    def fetch(page_number):
+        if limiter:
+            limiter.wait()
+        url = page_url(page_number, root_url)
         print(f"Scraping halaman: {url}")
- 
+        return fetching_content(url, fetcher=fetcher)
+
+    if workers <= 1:
+        for page_number in pages:
+            yield page_number, fetch(page_number)
+        return
+
+    pages = iter(pages)
+    pending = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
         try:
-            content = fetching_content(url)
-            if content:
-                soup = BeautifulSoup(content, "html.parser")
-                product_cards = soup.find_all('div', class_='collection-card')
-                
-                if not product_cards:
-                    print(f"Tidak menemukan produk di halaman {page_number}. Mungkin halaman terakhir.")
-                    break 
- 
-                for card in product_cards:
-                    product = extract_product_data(card)
-                    if product:
-                        data.append(product)
-                
-                time.sleep(delay) 
-            else:
-                print(f"Gagal mengambil konten dari halaman {page_number}. Melanjutkan...")
-                continue
- 
+            for page_number in pages:
+                pending.append((page_number, executor.submit(fetch, page_number)))
+                if len(pending) >= workers:
+                    break
+
+            while pending:
+                page_number, future = pending.popleft()
+                next_page = next(pages, None)
+                if next_page is not None:
+                    pending.append((next_page, executor.submit(fetch, next_page)))
+                yield page_number, future.result()
+        finally:
+            for _, future in pending:
+                future.cancel()
+
+def _run_now(fn, *args):
+    future = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+def iter_parsed_pages(pages, parser=DEFAULT_PARSER, parse_workers=0, max_pending=None, cache=None, root_url=None):
+
+    def start(page_number, content, submit):
+        if not content:
+            return page_number, None, None, None
+        digest = content_hash(content) if cache is not None else None
+        products = cache.load_products(page_url(page_number, root_url), digest) if digest else None
+        if products is not None:
+            timestamp = page_timestamp()
+            products = [product._replace(timestamp=timestamp) for product in as_products(products)]
+            return page_number, digest, products, None
+        # Parse worker processes have their own METRICS, so timings travel back with the result.
+        return page_number, digest, None, submit(_timed_parse, content, parser)
+
+    def finish(page_number, digest, products, future):
+        if future is None:
+            return page_number, products, products is not None
+        products, seconds = future.result()
+        _record_parse(products, seconds)
+        if digest:
+            cache.store_products(page_url(page_number, root_url), digest, products)
+        return page_number, products, False
+
+    def begin(page_number, content, submit):
+        try:
+            return start(page_number, content, submit)
         except Exception as e:
             print(f"An error occurred during scraping on page {page_number}: {e}")
-            continue 
+            return page_number, None, None, None
+
+    def resolve(item):
+        try:
+            return finish(*item)
+        except Exception as e:
+            print(f"An error occurred during scraping on page {item[0]}: {e}")
+            return item[0], None, False
+
+    if parse_workers <= 0:
+        for page_number, content in pages:
+            yield resolve(begin(page_number, content, _run_now))
+        return
+
+    max_pending = max_pending or parse_workers * 2
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=parse_workers) as executor:
+        try:
+            for page_number, content in pages:
+                pending.append(begin(page_number, content, executor.submit))
+                while len(pending) >= max_pending:
+                    yield resolve(pending.popleft())
+
+            while pending:
+                yield resolve(pending.popleft())
+        finally:
+            for item in pending:
+                if item[3] is not None:
+                    item[3].cancel()
+
+def _crawl_pages(page_numbers, fetcher, workers, limiter, parser, parse_workers, root_url):
+    pages = iter_page_contents(page_numbers, fetcher=fetcher, workers=workers, limiter=limiter, root_url=root_url)
+    parsed_pages = iter_parsed_pages(pages, parser=parser, parse_workers=parse_workers, cache=fetcher.cache, root_url=root_url)
+    try:
+        yield from parsed_pages
+    finally:
+        parsed_pages.close()
+        pages.close()
+
+def iter_page_products(delay=1, workers=1, rate_limit=None, fetcher=None, parser=DEFAULT_PARSER, parse_workers=0,
+                       root_url=None, start_page=1, end_page=MAX_PAGE, shard_index=0, shard_count=1,
+                       discover_pages=False, retry_rounds=1, checkpoint=None, resume=False, failed_pages=None):
+
+    limiter = RateLimiter(rate_limit) if rate_limit else None
+    owns_fetcher = fetcher is None
+    if owns_fetcher:
+        fetcher = Fetcher(pool_size=max(workers, 1))
+
+    if checkpoint:
+        scope = {"root_url": root_url or ROOT_URL, "shard_index": shard_index, "shard_count": shard_count}
+        checkpoint = CrawlCheckpoint(checkpoint, resume=resume, scope=scope)
+
+    try:
+        if discover_pages:
+            discovered = discover_page_count(fetcher, root_url)
+            if discovered:
+                print(f"Ditemukan {discovered} halaman dari tautan pagination.")
+                end_page = discovered
+
+        page_numbers = list(shard_pages(start_page, end_page, shard_index, shard_count))
+        last_page = None
+        if checkpoint:
+            last_page = checkpoint.last_page
+            resumed = [page_number for page_number in page_numbers if page_number in checkpoint.pages]
+            if resumed:
+                print(f"Melanjutkan crawl: {len(resumed)} halaman diambil dari checkpoint {checkpoint.path}.")
+                METRICS.incr("pages_resumed", len(resumed))
+            for page_number in resumed:
+                if checkpoint.pages[page_number]:
+                    yield page_number, checkpoint.pages[page_number]
+            page_numbers = [page_number for page_number in page_numbers
+                            if page_number not in checkpoint.pages and (last_page is None or page_number <= last_page)]
+
+        failed = []
+        for round_number in range(retry_rounds + 1):
+            if round_number:
+                page_numbers = [page_number for page_number in failed if last_page is None or page_number <= last_page]
+                if not page_numbers:
+                    break
+                print(f"Mencoba ulang {len(page_numbers)} halaman yang gagal: {', '.join(map(str, page_numbers))}")
+                METRICS.incr("pages_retried", len(page_numbers))
+                failed = []
+                time.sleep(delay)
+
+            crawl = _crawl_pages(page_numbers, fetcher, workers, limiter, parser, parse_workers, root_url)
+            try:
+                for page_number, products, unchanged in crawl:
+                    if products is None:
+                        print(f"Gagal mengambil konten dari halaman {page_number}. Dicoba ulang di akhir...")
+                        failed.append(page_number)
+                        continue
+
+                    if not products:
+                        print(f"Tidak menemukan produk di halaman {page_number}. Mungkin halaman terakhir.")
+                        last_page = page_number - 1
+                        if checkpoint:
+                            checkpoint.record(page_number, products)
+                        break
+
+                    if checkpoint:
+                        checkpoint.record(page_number, products)
+                    yield page_number, products
+
+                    if workers <= 1 and parse_workers <= 0 and limiter is None and not unchanged:
+                        time.sleep(delay)
+            finally:
+                crawl.close()
+
+        failed = [page_number for page_number in failed if last_page is None or page_number <= last_page]
+        if failed:
+            print(f"Halaman {', '.join(map(str, failed))} tetap gagal diambil. Jalankan ulang dengan --resume untuk mencobanya lagi.")
+            METRICS.incr("pages_failed", len(failed))
+            if failed_pages is not None:
+                failed_pages.extend(failed)
+    finally:
+        if checkpoint:
+            checkpoint.close()
+        if owns_fetcher:
+            fetcher.close()
+
+def iter_products(delay=1, **kwargs):
+    for _, products in iter_page_products(delay, **kwargs):
+        yield products
+
+def scrape_products(delay=1, **kwargs):
+
+    data = []
+    for products in iter_products(delay, **kwargs):
+        data.extend(products)
  
-    return data
\ No newline at end of file
+    return data
+
+def scrape_product_columns(delay=1, **kwargs):
+
+    columns = ProductColumns()
+    for products in iter_products(delay, failed_pages=columns.failed_pages, **kwargs):
+        columns.extend(products)
+    return columns
+
+def _scrape_shard(kwargs):
+    METRICS.reset()
+    failed_pages = []
+    pages = list(iter_page_products(failed_pages=failed_pages, **kwargs))
+    return pages, failed_pages, METRICS.snapshot()
+
+def scrape_products_sharded(shard_count, processes=None, **kwargs):
+
+    shards = [dict(kwargs, shard_index=index, shard_count=shard_count) for index in range(shard_count)]
+    for shard in shards:
+        if shard.get("checkpoint"):
+            shard["checkpoint"] = checkpoint_path(shard["checkpoint"], shard["shard_index"], shard_count)
+    with ProcessPoolExecutor(max_workers=processes or shard_count) as executor:
+        pages, failed_pages = [], []
+        for shard_result, shard_failed, snapshot in executor.map(_scrape_shard, shards):
+            METRICS.merge(snapshot)
+            pages.extend(shard_result)
+            failed_pages.extend(shard_failed)
+
+    columns = ProductColumns()
+    for _, products in sorted(pages, key=lambda page: page[0]):
+        columns.extend(products)
+    columns.failed_pages.extend(sorted(failed_pages))
+    return columns
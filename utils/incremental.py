@@ -0,0 +1,82 @@
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+
+import pandas as pd
+
+FINGERPRINT_FIELDS = ("Title", "Price", "Rating", "Colors", "Size", "Gender")
+
+def fingerprint(record: dict) -> str:
+    payload = "\x1f".join(str(record.get(name)) for name in FINGERPRINT_FIELDS)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+@dataclass
+class ChangeSet:
+    new: list = field(default_factory=list)
+    changed: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    fingerprints: dict = field(default_factory=dict)
+
+    @property
+    def records(self) -> list:
+        return self.new + self.changed
+
+    def __bool__(self):
+        return bool(self.new or self.changed or self.removed)
+
+class FingerprintIndex:
+
+    def __init__(self, path: str = ".cache/fingerprints.json", key_field: str = "Title"):
+        self.path = path
+        self.key_field = key_field
+        self.fingerprints = self._load()
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def diff(self, records: list, complete: bool = True) -> ChangeSet:
+        changes = ChangeSet()
+        for record in records:
+            key = record.get(self.key_field)
+            if key is None:
+                continue
+            if key in changes.fingerprints:
+                continue
+            digest = fingerprint(record)
+            previous = self.fingerprints.get(key)
+            changes.fingerprints[key] = digest
+            if previous is None:
+                changes.new.append(record)
+            elif previous != digest:
+                changes.changed.append(record)
+        if complete:
+            changes.removed = [key for key in self.fingerprints if key not in changes.fingerprints]
+        else:
+            changes.fingerprints = {**self.fingerprints, **changes.fingerprints}
+        return changes
+
+    def commit(self, changes: ChangeSet):
+        self.fingerprints = changes.fingerprints
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.fingerprints, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+
+def merge_delta(base: pd.DataFrame, delta: pd.DataFrame, removed, key_column: str = "Title") -> pd.DataFrame:
+    drop_keys = set(removed)
+    if len(delta.columns):
+        drop_keys.update(delta[key_column])
+    kept = base[~base[key_column].isin(drop_keys)]
+    if kept.empty:
+        return delta.reset_index(drop=True)
+    if delta.empty:
+        return kept.reset_index(drop=True)
+    return pd.concat([kept, delta], ignore_index=True)
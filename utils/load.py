@@ -1,74 +1,102 @@
+import importlib
 import pandas as pd
-from sqlalchemy import create_engine
 import os
+from datetime import datetime
+from utils.incremental import merge_delta
 
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
 
-def load_to_csv(df: pd.DataFrame, filename: str):
+_BACKEND_EXPORTS = {
+    "utils.sheets": ("load_to_google_sheets", "sync_to_google_sheets", "diff_sheet_rows"),
+    "utils.postgres": (
+        "get_engine", "dispose_engines", "copy_method",
+        "load_to_postgresql", "load_to_postgresql_upsert", "load_tables_to_postgresql",
+    ),
+}
+
+def __getattr__(name):
+    for module, names in _BACKEND_EXPORTS.items():
+        if name in names:
+            return getattr(importlib.import_module(module), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def iter_chunks(data):
+    if isinstance(data, pd.DataFrame):
+        yield data
+    else:
+        yield from data
+
+def load_to_csv(df, filename: str, append: bool = False, removed=None, key_column: str = "Title"):
 
     try:
-        df.to_csv(filename, index=False) 
+        if removed is not None:
+            base = pd.read_csv(filename) if os.path.exists(filename) else pd.DataFrame(columns=df.columns)
+            df = merge_delta(base, df, removed, key_column)
+
+        for chunk in iter_chunks(df):
+            chunk.to_csv(filename, index=False, mode='a' if append else 'w', header=not append)
+            append = True
         print(f"Data berhasil disimpan ke {filename}")
+        return True
     except PermissionError:
         print(f"Error: Gagal menyimpan ke {filename}. File mungkin sedang dibuka.")
+        return False
     except Exception as e:
         print(f"Terjadi kesalahan saat menyimpan ke CSV: {e}")
+        return False
 
-def load_to_google_sheets(df: pd.DataFrame, spreadsheet_id: str, credentials_path: str):
+def load_to_quarantine(rejected, filename: str):
 
     try:
-        if not os.path.exists(credentials_path):
-            print(f"Error: File credentials '{credentials_path}' tidak ditemukan.")
-            return
-
-        SERVICE_ACCOUNT_FILE = credentials_path
-        SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
-        
-        credential = Credentials.from_service_account_file(
-            SERVICE_ACCOUNT_FILE, scopes=SCOPES
-        )
-        print("Otentikasi Google Sheets berhasil.")
-
-        service = build('sheets', 'v4', credentials=credential)
-        sheet = service.spreadsheets()
-
-        print("Menghapus data lama di 'Sheet1'...")
-        sheet.values().clear(
-            spreadsheetId=spreadsheet_id,
-            range='Sheet1'
-        ).execute()
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        header = not os.path.exists(filename)
+        rejected.assign(quarantined_at=datetime.now().isoformat()).to_csv(filename, index=False, mode='a', header=header)
+        print(f"{len(rejected)} baris ditolak disimpan ke karantina {filename}")
+        return True
+    except Exception as e:
+        print(f"Terjadi kesalahan saat menyimpan data karantina: {e}")
+        return False
 
-        header = df.columns.tolist()
-        values = df.values.tolist()
-        data_to_write = [header] + values
-        
-        body = {
-            'values': data_to_write
-        }
+def _with_scrape_date(df: pd.DataFrame) -> pd.DataFrame:
+    if pd.api.types.is_datetime64_any_dtype(df['timestamp']):
+        scrape_date = df['timestamp'].dt.strftime('%Y-%m-%d')
+    else:
+        scrape_date = df['timestamp'].astype(str).str.slice(0, 10)
+    return df.assign(scrape_date=scrape_date)
 
-        print(f"Menulis {len(data_to_write)} baris data baru ke 'Sheet1!A1'...")
-        result = sheet.values().update(
-            spreadsheetId=spreadsheet_id,
-            range='Sheet1!A1', 
-            valueInputOption='RAW',
-            body=body
-        ).execute()
-        
-        print(f"Data berhasil disimpan ke Google Sheets (ID: {spreadsheet_id})")
+def load_to_parquet(df, root_path: str, partition_cols=("scrape_date", "Gender"), compression: str = "zstd"):
 
-    except Exception as e:
-        print(f"Terjadi kesalahan saat menyimpan ke Google Sheets: {e}")
-
-def load_to_postgresql(df: pd.DataFrame, db_url: str, table_name: str):
+    if pa is None:
+        print("Error: Library 'pyarrow' belum terinstall.")
+        return False
 
     try:
-        engine = create_engine(db_url)
-
-        df.to_sql(table_name, engine, if_exists='replace', index=False)
-        
-        print(f"Data berhasil disimpan ke PostgreSQL, tabel: '{table_name}'")
-    except ImportError:
-        print("Error: Library 'sqlalchemy' atau 'psycopg2' belum terinstall.")
+        import pyarrow.dataset as pa_dataset
+        snapshot_id = datetime.now().strftime("%Y%m%dT%H%M%S%f")
+        file_options = pa_dataset.ParquetFileFormat().make_write_options(compression=compression)
+        total_rows = 0
+        for chunk_number, chunk in enumerate(iter_chunks(df)):
+            if chunk.empty:
+                continue
+            table = pa.Table.from_pandas(_with_scrape_date(chunk), preserve_index=False)
+            pa_dataset.write_dataset(
+                table,
+                root_path,
+                format="parquet",
+                partitioning=list(partition_cols),
+                partitioning_flavor="hive",
+                basename_template=f"part-{snapshot_id}-{chunk_number}-{{i}}.parquet",
+                existing_data_behavior="overwrite_or_ignore",
+                file_options=file_options,
+            )
+            total_rows += len(chunk)
+        print(f"{total_rows} baris berhasil ditambahkan ke dataset Parquet {root_path}")
+        return True
     except Exception as e:
-        print(f"Terjadi kesalahan saat menyimpan ke PostgreSQL: {e}")
\ No newline at end of file
+        print(f"Terjadi kesalahan saat menyimpan ke Parquet: {e}")
+        return False
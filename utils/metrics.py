@@ -0,0 +1,154 @@
+import cProfile
+import functools
+import io
+import json
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+def peak_rss_bytes():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+class Metrics:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.started = time.perf_counter()
+            self.timers = defaultdict(lambda: {"count": 0, "total": 0.0, "max": 0.0})
+            self.counters = defaultdict(float)
+
+    @contextmanager
+    def timer(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start)
+
+    def timed(self, name: str):
+        def decorator(fn):
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.timer(name):
+                    return fn(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def timed_iter(self, name: str, iterable):
+        iterator = iter(iterable)
+        while True:
+            with self.timer(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def observe(self, name: str, seconds: float):
+        with self._lock:
+            timer = self.timers[name]
+            timer["count"] += 1
+            timer["total"] += seconds
+            timer["max"] = max(timer["max"], seconds)
+
+    def incr(self, name: str, value: float = 1):
+        with self._lock:
+            self.counters[name] += value
+
+    def merge(self, snapshot: dict):
+        with self._lock:
+            for name, values in snapshot.get("timers", {}).items():
+                timer = self.timers[name]
+                timer["count"] += values["count"]
+                timer["total"] += values["total"]
+                timer["max"] = max(timer["max"], values["max"])
+            for name, value in snapshot.get("counters", {}).items():
+                self.counters[name] += value
+
+    def _rate(self, counter: str, timer: str):
+        seconds = self.timers[timer]["total"] if timer in self.timers else 0.0
+        return self.counters.get(counter, 0) / seconds if seconds else None
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "elapsed_seconds": time.perf_counter() - self.started,
+                "timers": {name: dict(values) for name, values in self.timers.items()},
+                "counters": dict(self.counters),
+                "rates": {
+                    "pages_per_second": self._rate("pages_fetched", "extract"),
+                    "rows_per_second_transform": self._rate("rows_transformed", "transform"),
+                    "rows_per_second_load": self._rate("rows_loaded", "load"),
+                },
+                "peak_rss_bytes": peak_rss_bytes(),
+            }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self, prefix: str = "etl") -> str:
+        snapshot = self.snapshot()
+        lines = [
+            f"# TYPE {prefix}_stage_seconds_total counter",
+            *(f'{prefix}_stage_seconds_total{{stage="{name}"}} {values["total"]:.6f}' for name, values in snapshot["timers"].items()),
+            f"# TYPE {prefix}_stage_calls_total counter",
+            *(f'{prefix}_stage_calls_total{{stage="{name}"}} {values["count"]}' for name, values in snapshot["timers"].items()),
+            f"# TYPE {prefix}_stage_seconds_max gauge",
+            *(f'{prefix}_stage_seconds_max{{stage="{name}"}} {values["max"]:.6f}' for name, values in snapshot["timers"].items()),
+        ]
+        for name, value in snapshot["counters"].items():
+            lines += [f"# TYPE {prefix}_{name}_total counter", f"{prefix}_{name}_total {value:g}"]
+        for name, value in snapshot["rates"].items():
+            if value is not None:
+                lines += [f"# TYPE {prefix}_{name} gauge", f"{prefix}_{name} {value:.6f}"]
+        if snapshot["peak_rss_bytes"] is not None:
+            lines += [f"# TYPE {prefix}_peak_rss_bytes gauge", f"{prefix}_peak_rss_bytes {snapshot['peak_rss_bytes']}"]
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: str, fmt: str = "json"):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus() if fmt == "prometheus" else self.to_json())
+
+METRICS = Metrics()
+
+@contextmanager
+def profiling(cprofile: bool = False, trace_memory: bool = False, output: str = None, top: int = 20):
+    profiler = cProfile.Profile() if cprofile else None
+    if trace_memory:
+        tracemalloc.start()
+    if profiler:
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler:
+            profiler.disable()
+            if output:
+                profiler.dump_stats(output)
+                print(f"Hasil cProfile disimpan ke {output}")
+            stream = io.StringIO()
+            pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(top)
+            print(stream.getvalue())
+        if trace_memory:
+            snapshot = tracemalloc.take_snapshot()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"Peak alokasi Python (tracemalloc): {peak / 2**20:.1f} MB")
+            for stat in snapshot.statistics("lineno")[:top]:
+                print(stat)
@@ -0,0 +1,72 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from dataclasses import dataclass
+from utils.metrics import METRICS
+
+@dataclass
+class SinkResult:
+    name: str
+    ok: bool
+    duration: float
+    rows: int
+    error: str = None
+
+class LoadOrchestrator:
+
+    def __init__(self, timeout: float = None, running: dict = None):
+        self.timeout = timeout
+        self.sinks = {}
+        self.running = running if running is not None else {}
+
+    def register(self, name: str, loader, timeout: float = None):
+        self.sinks[name] = (loader, timeout if timeout is not None else self.timeout)
+        return self
+
+    def _run_sink(self, name, loader, df, rows):
+        start = time.perf_counter()
+        try:
+            with METRICS.timer(f"load.{name}"):
+                ok = loader(df) is not False
+            error = None if ok else "loader melaporkan kegagalan"
+        except Exception as e:
+            ok, error = False, str(e)
+        return SinkResult(name, ok, time.perf_counter() - start, rows if ok else 0, error)
+
+    def run(self, df) -> list:
+        if not self.sinks:
+            return []
+
+        rows = len(df) if hasattr(df, "__len__") else 0
+        start = time.perf_counter()
+        results = []
+        futures = {}
+        # A sink that timed out is only abandoned, its thread keeps running (and delays interpreter exit).
+        # Skip it until it finishes so it never overlaps with its own next write.
+        for name in self.sinks:
+            previous = self.running.get(name)
+            if previous is not None and not previous.done():
+                results.append(SinkResult(name, False, 0.0, 0, "run sebelumnya masih berjalan"))
+        executor = ThreadPoolExecutor(max_workers=len(self.sinks), thread_name_prefix="sink")
+        for name, (loader, _) in self.sinks.items():
+            if not any(result.name == name for result in results):
+                futures[name] = self.running[name] = executor.submit(self._run_sink, name, loader, df, rows)
+
+        for name, future in futures.items():
+            timeout = self.sinks[name][1]
+            remaining = None if timeout is None else max(0.0, start + timeout - time.perf_counter())
+            try:
+                results.append(future.result(timeout=remaining))
+            except TimeoutError:
+                results.append(SinkResult(name, False, time.perf_counter() - start, 0, f"timeout setelah {timeout} detik"))
+
+        executor.shutdown(wait=False, cancel_futures=True)
+        METRICS.observe("load", time.perf_counter() - start)
+        METRICS.incr("rows_loaded", sum(result.rows for result in results))
+        return results
+
+def format_summary(results: list) -> str:
+    lines = [f"{'Sink':<12}{'Status':<8}{'Durasi (s)':>12}{'Baris':>8}  Keterangan"]
+    for result in results:
+        status = "OK" if result.ok else "GAGAL"
+        lines.append(f"{result.name:<12}{status:<8}{result.duration:>12.2f}{result.rows:>8}  {result.error or ''}")
+    return "\n".join(lines)
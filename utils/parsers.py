@@ -0,0 +1,138 @@
+from datetime import datetime
+from bs4 import BeautifulSoup
+from bs4.dammit import UnicodeDammit
+from utils.metrics import METRICS
+from utils.records import Product, intern
+
+try:
+    from lxml import etree
+    from lxml import html as lxml_html
+except ImportError:
+    etree = None
+    lxml_html = None
+
+def page_timestamp():
+    return intern(datetime.now().isoformat())
+
+def build_product(title, price, texts, timestamp=None):
+    rating, colors, size, gender = None, None, None, None
+ 
+    for text in texts:
+        if text.startswith("Rating:"):
+            rating = intern(text)
+        elif text.endswith("Colors") or text.endswith("Colors:"):
+            colors = intern(text)
+        elif text.startswith("Size:"):
+            size = intern(text)
+        elif text.startswith("Gender:"):
+            gender = intern(text)
+ 
+    return Product(title, price, rating, colors, size, gender, timestamp or page_timestamp())
+
+def extract_product_data(card, timestamp=None):
+ 
+    details = card.find('div', class_='product-details')
+    if not details:
+        return None
+ 
+    title_element = details.find('h3', class_='product-title')
+    title = title_element.text.strip() if title_element else None
+ 
+    price_container = card.find('div', class_='price-container')
+    price_span = price_container.find('span', class_='price') if price_container else None
+    
+    if not price_span:
+        price_p = card.find('p', class_='price')
+        price = price_p.text.strip() if price_p else None
+    else:
+        price = price_span.text.strip() if price_span else None
+
+    texts = [p.text.strip() for p in details.find_all('p')]
+    return build_product(title, price, texts, timestamp)
+
+class SoupParser:
+
+    name = "html.parser"
+
+    def parse(self, content):
+        soup = BeautifulSoup(content, "html.parser")
+        timestamp = page_timestamp()
+        products = []
+        for card in soup.find_all('div', class_='collection-card'):
+            with METRICS.timer("extract_product_data"):
+                product = extract_product_data(card, timestamp)
+            if product:
+                products.append(product)
+        return products
+
+def _has_class(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+class LxmlParser:
+
+    name = "lxml"
+
+    if etree is not None:
+        CARDS = etree.XPath(f"//div[{_has_class('collection-card')}]")
+        DETAILS = etree.XPath(f".//div[{_has_class('product-details')}]")
+        TITLE = etree.XPath(f".//h3[{_has_class('product-title')}]")
+        PRICE_CONTAINER = etree.XPath(f".//div[{_has_class('price-container')}]")
+        PRICE_SPAN = etree.XPath(f".//span[{_has_class('price')}]")
+        PRICE_P = etree.XPath(f".//p[{_has_class('price')}]")
+        PARAGRAPHS = etree.XPath(".//p")
+
+    @staticmethod
+    def _first(xpath, element):
+        found = xpath(element)
+        return found[0] if found else None
+
+    def extract(self, card, timestamp=None):
+        details = self._first(self.DETAILS, card)
+        if details is None:
+            return None
+
+        title_element = self._first(self.TITLE, details)
+        title = title_element.text_content().strip() if title_element is not None else None
+
+        price_container = self._first(self.PRICE_CONTAINER, card)
+        price_span = self._first(self.PRICE_SPAN, price_container) if price_container is not None else None
+
+        if price_span is None:
+            price_p = self._first(self.PRICE_P, card)
+            price = price_p.text_content().strip() if price_p is not None else None
+        else:
+            price = price_span.text_content().strip()
+
+        texts = [p.text_content().strip() for p in self.PARAGRAPHS(details)]
+        return build_product(title, price, texts, timestamp)
+
+    def parse(self, content):
+        if isinstance(content, bytes):
+            content = UnicodeDammit(content, is_html=True).unicode_markup
+        if not content or not content.strip():
+            return []
+
+        tree = lxml_html.fromstring(content)
+        timestamp = page_timestamp()
+        products = []
+        for card in self.CARDS(tree):
+            with METRICS.timer("extract_product_data"):
+                product = self.extract(card, timestamp)
+            if product:
+                products.append(product)
+        return products
+
+PARSERS = {
+    SoupParser.name: SoupParser,
+    LxmlParser.name: LxmlParser,
+}
+
+DEFAULT_PARSER = LxmlParser.name if etree is not None else SoupParser.name
+
+def get_parser(name=DEFAULT_PARSER):
+    if name not in PARSERS:
+        raise ValueError(f"Parser '{name}' tidak dikenal. Pilihan: {', '.join(PARSERS)}")
+    if name == LxmlParser.name and etree is None:
+        print("Peringatan: 'lxml' belum terinstall. Menggunakan parser 'html.parser'.")
+        name = SoupParser.name
+    return PARSERS[name]()
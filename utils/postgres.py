@@ -0,0 +1,160 @@
+import atexit
+import csv
+import io
+import threading
+import pandas as pd
+from sqlalchemy import create_engine, text
+from utils.load import iter_chunks
+
+_ENGINES = {}
+_ENGINES_LOCK = threading.Lock()
+
+def get_engine(db_url: str, pool_size: int = 5, max_overflow: int = 5, pool_recycle: int = 1800):
+    with _ENGINES_LOCK:
+        engine = _ENGINES.get(db_url)
+        if engine is None:
+            options = {"pool_pre_ping": True}
+            if not db_url.startswith("sqlite"):
+                options.update(pool_size=pool_size, max_overflow=max_overflow, pool_recycle=pool_recycle)
+            engine = create_engine(db_url, **options)
+            _ENGINES[db_url] = engine
+        return engine
+
+def dispose_engines():
+    with _ENGINES_LOCK:
+        for engine in _ENGINES.values():
+            engine.dispose()
+        _ENGINES.clear()
+
+atexit.register(dispose_engines)
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+def _copy_rows(dbapi_conn, table_name: str, columns, rows):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    column_list = ', '.join(_quote(c) for c in columns)
+    with dbapi_conn.cursor() as cur:
+        cur.copy_expert(f"COPY {table_name} ({column_list}) FROM STDIN WITH (FORMAT csv)", buffer)
+
+def copy_method(table, conn, keys, data_iter):
+    name = f"{_quote(table.schema)}.{_quote(table.name)}" if table.schema else _quote(table.name)
+    _copy_rows(conn.connection, name, keys, data_iter)
+
+def _pg_type(dtype) -> str:
+    if pd.api.types.is_bool_dtype(dtype):
+        return "BOOLEAN"
+    if pd.api.types.is_integer_dtype(dtype):
+        return "BIGINT"
+    if pd.api.types.is_float_dtype(dtype):
+        return "DOUBLE PRECISION"
+    if pd.api.types.is_datetime64_any_dtype(dtype):
+        return "TIMESTAMP"
+    return "TEXT"
+
+def load_to_postgresql(df, db_url: str, table_name: str, append: bool = False, method=None):
+
+    try:
+        engine = get_engine(db_url)
+
+        for chunk in iter_chunks(df):
+            chunk.to_sql(table_name, engine, if_exists='append' if append else 'replace', index=False, method=method)
+            append = True
+        
+        print(f"Data berhasil disimpan ke PostgreSQL, tabel: '{table_name}'")
+        return True
+    except ImportError:
+        print("Error: Library 'sqlalchemy' atau 'psycopg2' belum terinstall.")
+        return False
+    except Exception as e:
+        print(f"Terjadi kesalahan saat menyimpan ke PostgreSQL: {e}")
+        return False
+
+def _upsert(conn, df, table_name: str, key_columns=("Title",), index_columns=("Gender", "Size")) -> int:
+    target = _quote(table_name)
+    staging = _quote(f"{table_name}_staging")
+    key_list = ', '.join(_quote(c) for c in key_columns)
+    total_rows = 0
+
+    for chunk in iter_chunks(df):
+        if chunk.empty:
+            continue
+        columns = chunk.columns.tolist()
+        if total_rows == 0:
+            column_defs = ', '.join(f"{_quote(c)} {_pg_type(chunk[c].dtype)}" for c in columns)
+            conn.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {target} ({column_defs}, PRIMARY KEY ({key_list}))"
+            ))
+            has_primary_key = conn.execute(
+                text("SELECT 1 FROM pg_index WHERE indrelid = to_regclass(:t) AND indisprimary"),
+                {"t": target},
+            ).first()
+            if not has_primary_key:
+                conn.execute(text(f"ALTER TABLE {target} ADD PRIMARY KEY ({key_list})"))
+            for column in index_columns:
+                if column in columns:
+                    index_name = _quote(f"{table_name}_{column.lower()}_idx")
+                    conn.execute(text(f"CREATE INDEX IF NOT EXISTS {index_name} ON {target} ({_quote(column)})"))
+            conn.execute(text(
+                f"CREATE TEMP TABLE {staging} (LIKE {target} INCLUDING DEFAULTS) ON COMMIT DROP"
+            ))
+
+        _copy_rows(conn.connection, staging, columns, chunk.itertuples(index=False, name=None))
+        total_rows += len(chunk)
+
+    if total_rows:
+        column_list = ', '.join(_quote(c) for c in columns)
+        updates = ', '.join(f"{_quote(c)} = EXCLUDED.{_quote(c)}" for c in columns if c not in key_columns)
+        changed = ' OR '.join(f"{target}.{_quote(c)} IS DISTINCT FROM EXCLUDED.{_quote(c)}" for c in columns if c not in key_columns)
+        on_conflict = f"DO UPDATE SET {updates} WHERE {changed}" if updates else "DO NOTHING"
+        conn.execute(text(
+            f"INSERT INTO {target} ({column_list}) "
+            f"SELECT DISTINCT ON ({key_list}) {column_list} FROM {staging} "
+            f"ON CONFLICT ({key_list}) {on_conflict}"
+        ))
+    return total_rows
+
+def _delete_keys(conn, table_name: str, key_column: str, keys) -> int:
+    result = conn.execute(
+        text(f"DELETE FROM {_quote(table_name)} WHERE {_quote(key_column)} = ANY(:keys)"),
+        {"keys": list(keys)},
+    )
+    return result.rowcount
+
+def load_to_postgresql_upsert(df, db_url: str, table_name: str, key_columns=("Title",), index_columns=("Gender", "Size"),
+                              removed=None):
+
+    try:
+        engine = get_engine(db_url)
+        with engine.begin() as conn:
+            total_rows = _upsert(conn, df, table_name, key_columns, index_columns)
+            if removed:
+                deleted = _delete_keys(conn, table_name, key_columns[0], removed)
+                print(f"{deleted} baris dihapus dari PostgreSQL, tabel: '{table_name}'")
+
+        print(f"{total_rows} baris berhasil di-upsert ke PostgreSQL, tabel: '{table_name}'")
+        return True
+    except ImportError:
+        print("Error: Library 'sqlalchemy' atau 'psycopg2' belum terinstall.")
+        return False
+    except Exception as e:
+        print(f"Terjadi kesalahan saat menyimpan ke PostgreSQL: {e}")
+        return False
+
+def load_tables_to_postgresql(tables: dict, db_url: str, key_columns=("Title",), index_columns=("Gender", "Size")) -> bool:
+
+    try:
+        engine = get_engine(db_url)
+        with engine.begin() as conn:
+            counts = {name: _upsert(conn, df, name, key_columns, index_columns) for name, df in tables.items()}
+
+        for name, total_rows in counts.items():
+            print(f"{total_rows} baris berhasil di-upsert ke PostgreSQL, tabel: '{name}'")
+        return True
+    except ImportError:
+        print("Error: Library 'sqlalchemy' atau 'psycopg2' belum terinstall.")
+    except Exception as e:
+        print(f"Terjadi kesalahan saat menyimpan ke PostgreSQL, semua tabel dibatalkan: {e}")
+    return False
@@ -0,0 +1,65 @@
+import sys
+from typing import NamedTuple, Optional
+
+import pandas as pd
+
+class Product(NamedTuple):
+    Title: Optional[str]
+    Price: Optional[str]
+    Rating: Optional[str]
+    Colors: Optional[str]
+    Size: Optional[str]
+    Gender: Optional[str]
+    timestamp: Optional[str]
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key):
+        return key in self._fields
+
+    def keys(self):
+        return self._fields
+
+    def get(self, key, default=None):
+        return getattr(self, key, default) if key in self._fields else default
+
+FIELDS = Product._fields
+
+def intern(text):
+    return sys.intern(text) if text is not None else None
+
+def as_products(rows) -> list:
+    return [Product(**row) if isinstance(row, dict) else Product(*row) for row in rows]
+
+class ProductColumns:
+
+    def __init__(self):
+        self.columns = {name: [] for name in FIELDS}
+        self.failed_pages = []
+
+    def append(self, product):
+        if isinstance(product, dict):
+            product = [product.get(name) for name in FIELDS]
+        for name, value in zip(FIELDS, product):
+            self.columns[name].append(value)
+
+    def extend(self, products):
+        for product in products:
+            self.append(product)
+
+    def __len__(self):
+        return len(self.columns[FIELDS[0]])
+
+    def __iter__(self):
+        return (Product(*values) for values in zip(*self.columns.values()))
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.columns, columns=list(FIELDS))
+
+def to_frame(data) -> pd.DataFrame:
+    if isinstance(data, ProductColumns):
+        return data.to_frame()
+    return pd.DataFrame(data)
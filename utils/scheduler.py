@@ -0,0 +1,259 @@
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Optional
+
+from utils.records import ProductColumns
+
+STAGES = ("extract", "transform", "load")
+
+_DONE = object()
+
+@dataclass
+class RunRecord:
+    run_id: int
+    started_at: str
+    status: str = "running"
+    rows: int = 0
+    duration: float = 0.0
+    stages: dict = field(default_factory=lambda: dict.fromkeys(STAGES, 0.0))
+    failed_sinks: list = field(default_factory=list)
+    error: Optional[str] = None
+
+def percentile(values: list, fraction: float):
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+class PipelineDaemon:
+
+    def __init__(self, extract, transform, load, chunk_size: int = 1000, interval: float = 300,
+                 history_size: int = 100, history_path: str = None, queue_size: int = 4):
+        self.extract = extract
+        self.transform = transform
+        self.load = load
+        self.chunk_size = chunk_size
+        self.interval = interval
+        self.history_path = history_path
+        self.queue_size = queue_size
+        self.history = deque(self._load_history(history_size), maxlen=history_size)
+        self.runs_started = 0
+        self._next_id = max((record["run_id"] for record in self.history), default=0) + 1
+        self._executor = ThreadPoolExecutor(max_workers=len(STAGES), thread_name_prefix="pipeline")
+        self._lock = None
+        self._stop = None
+        self._tasks = set()
+        self.status_address = None
+
+    def _load_history(self, history_size: int) -> list:
+        if not self.history_path or not os.path.exists(self.history_path):
+            return []
+        records = deque(maxlen=history_size)
+        with open(self.history_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue
+        return list(records)
+
+    def _record(self, record: RunRecord):
+        entry = asdict(record)
+        self.history.append(entry)
+        if self.history_path:
+            directory = os.path.dirname(self.history_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.history_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+
+    def _new_record(self) -> RunRecord:
+        record = RunRecord(self._next_id, datetime.now().isoformat(timespec="seconds"))
+        self._next_id += 1
+        return record
+
+    def _ensure_async_state(self):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+            self._stop = asyncio.Event()
+
+    async def run_once(self) -> RunRecord:
+        self._ensure_async_state()
+        if self._lock.locked():
+            record = self._new_record()
+            record.status = "skipped"
+            record.error = "run sebelumnya masih berjalan"
+            print(f"Run #{record.run_id} dilewati: run sebelumnya masih berjalan.")
+            self._record(record)
+            return record
+
+        async with self._lock:
+            record = self._new_record()
+            self.runs_started += 1
+            print(f"\nMemulai run #{record.run_id}...")
+            start = time.perf_counter()
+            try:
+                await self._run_stages(record)
+                record.status = "failed" if record.failed_sinks else ("ok" if record.rows else "empty")
+            except Exception as e:
+                record.status, record.error = "failed", str(e)
+                print(f"Run #{record.run_id} gagal: {e}")
+            record.duration = time.perf_counter() - start
+            print(f"Run #{record.run_id} selesai ({record.status}) dalam {record.duration:.2f} detik, {record.rows} baris dimuat.")
+            self._record(record)
+            return record
+
+    def _produce(self, loop, pages: asyncio.Queue, cancelled, record: RunRecord):
+        iterator = iter(self.extract())
+        try:
+            while not cancelled():
+                start = time.perf_counter()
+                batch = next(iterator, _DONE)
+                record.stages["extract"] += time.perf_counter() - start
+                asyncio.run_coroutine_threadsafe(pages.put(batch), loop).result()
+                if batch is _DONE:
+                    return
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    async def _transform_stage(self, loop, pages: asyncio.Queue, frames: asyncio.Queue, record: RunRecord):
+
+        async def flush(buffer):
+            start = time.perf_counter()
+            df = await loop.run_in_executor(self._executor, self.transform, buffer)
+            record.stages["transform"] += time.perf_counter() - start
+            if not df.empty:
+                await frames.put(df)
+
+        buffer = ProductColumns()
+        while True:
+            batch = await pages.get()
+            if batch is _DONE:
+                break
+            buffer.extend(batch)
+            if len(buffer) >= self.chunk_size:
+                await flush(buffer)
+                buffer = ProductColumns()
+        if len(buffer):
+            await flush(buffer)
+        await frames.put(_DONE)
+
+    async def _load_stage(self, loop, frames: asyncio.Queue, record: RunRecord):
+        while True:
+            df = await frames.get()
+            if df is _DONE:
+                return
+            start = time.perf_counter()
+            results = await loop.run_in_executor(self._executor, self.load, df, record.rows > 0)
+            record.stages["load"] += time.perf_counter() - start
+            record.rows += len(df)
+            for result in results or []:
+                if not result.ok and result.name not in record.failed_sinks:
+                    record.failed_sinks.append(result.name)
+
+    async def _run_stages(self, record: RunRecord):
+        loop = asyncio.get_running_loop()
+        pages = asyncio.Queue(maxsize=self.queue_size)
+        frames = asyncio.Queue(maxsize=self.queue_size)
+        cancelled = False
+
+        tasks = [
+            loop.run_in_executor(self._executor, self._produce, loop, pages, lambda: cancelled, record),
+            asyncio.ensure_future(self._transform_stage(loop, pages, frames, record)),
+            asyncio.ensure_future(self._load_stage(loop, frames, record)),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            cancelled = True
+            for task in tasks[1:]:
+                task.cancel()
+            # Unblock the extract thread if it is waiting on a full queue so it can see the cancellation.
+            while not tasks[0].done():
+                while not pages.empty():
+                    pages.get_nowait()
+                await asyncio.sleep(0.01)
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def summary(self) -> dict:
+        runs = [record for record in self.history if record["status"] != "skipped"]
+        latencies = {"total": [record["duration"] for record in runs]}
+        for stage in STAGES:
+            latencies[stage] = [record["stages"][stage] for record in runs]
+        return {
+            "runs": len(runs),
+            "ok": sum(record["status"] == "ok" for record in runs),
+            "failed": sum(record["status"] == "failed" for record in runs),
+            "skipped": sum(record["status"] == "skipped" for record in self.history),
+            "running": bool(self._lock and self._lock.locked()),
+            "latency": {
+                name: {"p50": percentile(values, 0.5), "p95": percentile(values, 0.95)}
+                for name, values in latencies.items()
+            },
+            "last_run": self.history[-1] if self.history else None,
+        }
+
+    async def _handle_status(self, reader, writer):
+        try:
+            await reader.readline()
+            body = json.dumps({"summary": self.summary(), "history": list(self.history)}).encode("utf-8")
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                + f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("ascii")
+                + body
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+    def trigger(self) -> asyncio.Task:
+        task = asyncio.ensure_future(self.run_once())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def stop(self):
+        if self._stop is not None:
+            print("\nMenghentikan daemon setelah run yang sedang berjalan selesai...")
+            self._stop.set()
+
+    async def serve(self, max_runs: int = None, status_port: int = None, status_host: str = "127.0.0.1"):
+        self._ensure_async_state()
+        server = None
+        if status_port is not None:
+            server = await asyncio.start_server(self._handle_status, status_host, status_port)
+            self.status_address = server.sockets[0].getsockname()[:2]
+            print(f"Status daemon tersedia di http://{self.status_address[0]}:{self.status_address[1]}/")
+
+        try:
+            # Runs are triggered on a fixed schedule. A trigger that fires while a run is still
+            # going is recorded as skipped instead of queueing up behind it.
+            while not self._stop.is_set():
+                self.trigger()
+                await asyncio.sleep(0)
+                if max_runs is not None and self.runs_started >= max_runs:
+                    break
+                try:
+                    await asyncio.wait_for(self._stop.wait(), timeout=self.interval)
+                except asyncio.TimeoutError:
+                    pass
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+        finally:
+            if server is not None:
+                server.close()
+                await server.wait_closed()
+            self.close()
+        return self.summary()
+
+    def close(self):
+        self._executor.shutdown(wait=True)
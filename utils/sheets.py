@@ -0,0 +1,232 @@
+import json
+import os
+import threading
+import time
+from google.oauth2.service_account import Credentials
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from utils.load import iter_chunks
+
+def _build_sheets_service(credentials_path: str):
+    if not os.path.exists(credentials_path):
+        print(f"Error: File credentials '{credentials_path}' tidak ditemukan.")
+        return None
+
+    SERVICE_ACCOUNT_FILE = credentials_path
+    SCOPES = ['https://www.googleapis.com/auth/spreadsheets']
+    
+    credential = Credentials.from_service_account_file(
+        SERVICE_ACCOUNT_FILE, scopes=SCOPES
+    )
+    print("Otentikasi Google Sheets berhasil.")
+
+    return build('sheets', 'v4', credentials=credential)
+
+# The service is cached so long-running processes keep the authenticated client warm.
+# Its httplib2 transport is not thread-safe: only one thread may use a cached service at a time.
+# LoadOrchestrator skips a sheets sink whose previous write is still running, which keeps it that way.
+_SERVICES = {}
+_SERVICES_LOCK = threading.Lock()
+
+def get_sheets_service(credentials_path: str):
+    with _SERVICES_LOCK:
+        service = _SERVICES.get(credentials_path)
+        if service is None:
+            service = _build_sheets_service(credentials_path)
+            if service is not None:
+                _SERVICES[credentials_path] = service
+        return service
+
+def reset_sheets_services():
+    with _SERVICES_LOCK:
+        _SERVICES.clear()
+
+def load_to_google_sheets(df, spreadsheet_id: str, credentials_path: str, append: bool = False):
+
+    try:
+        service = get_sheets_service(credentials_path)
+        if service is None:
+            return False
+        sheet = service.spreadsheets()
+
+        for chunk in iter_chunks(df):
+            if not append:
+                print("Menghapus data lama di 'Sheet1'...")
+                sheet.values().clear(
+                    spreadsheetId=spreadsheet_id,
+                    range='Sheet1'
+                ).execute()
+
+                header = chunk.columns.tolist()
+                values = chunk.values.tolist()
+                data_to_write = [header] + values
+                
+                body = {
+                    'values': data_to_write
+                }
+
+                print(f"Menulis {len(data_to_write)} baris data baru ke 'Sheet1!A1'...")
+                sheet.values().update(
+                    spreadsheetId=spreadsheet_id,
+                    range='Sheet1!A1', 
+                    valueInputOption='RAW',
+                    body=body
+                ).execute()
+            else:
+                values = chunk.values.tolist()
+                print(f"Menambahkan {len(values)} baris data ke 'Sheet1'...")
+                sheet.values().append(
+                    spreadsheetId=spreadsheet_id,
+                    range='Sheet1',
+                    valueInputOption='RAW',
+                    insertDataOption='INSERT_ROWS',
+                    body={'values': values}
+                ).execute()
+            append = True
+        
+        print(f"Data berhasil disimpan ke Google Sheets (ID: {spreadsheet_id})")
+        return True
+
+    except Exception as e:
+        print(f"Terjadi kesalahan saat menyimpan ke Google Sheets: {e}")
+        return False
+
+SHEETS_RETRY_STATUS = (429, 500, 502, 503)
+
+def _execute_with_retry(request, retries: int = 5, backoff: float = 1.0):
+    for attempt in range(retries + 1):
+        try:
+            return request.execute()
+        except HttpError as e:
+            if e.resp.status not in SHEETS_RETRY_STATUS or attempt == retries:
+                raise
+            wait = backoff * (2 ** attempt)
+            print(f"Google Sheets membalas {e.resp.status}, mencoba lagi dalam {wait:.1f} detik...")
+            time.sleep(wait)
+
+def _column_letter(number: int) -> str:
+    letters = ""
+    while number > 0:
+        number, remainder = divmod(number - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+def _row_ranges(rows: dict, max_cells: int, width: int):
+    block = []
+    for row_number in sorted(rows):
+        if block and (row_number != block[-1] + 1 or (len(block) + 1) * width > max_cells):
+            yield block
+            block = []
+        block.append(row_number)
+    if block:
+        yield block
+
+def _write_batches(writes: dict, max_cells: int, width: int):
+    batch, cells = [], 0
+    for block in _row_ranges(writes, max_cells, width):
+        block_cells = len(block) * width
+        if batch and cells + block_cells > max_cells:
+            yield batch
+            batch, cells = [], 0
+        batch.append(block)
+        cells += block_cells
+    if batch:
+        yield batch
+
+def diff_sheet_rows(current: list, header: list, rows: list, key_column: str, ignore_columns=("timestamp",)):
+    if not current or current[0] != header:
+        writes = {row_number: row for row_number, row in enumerate([header] + rows, start=1)}
+        return writes, list(range(len(rows) + 2, len(current) + 1))
+
+    ignored = {header.index(name) for name in ignore_columns if name in header}
+    comparable = lambda row: [value for index, value in enumerate(row) if index not in ignored]
+    key_index = header.index(key_column)
+    last_row = len(rows) + 1
+    positions = {}
+    for row_number, row in enumerate(current[1:], start=2):
+        if len(row) > key_index:
+            positions.setdefault(row[key_index], row_number)
+
+    writes, occupied, pending = {}, set(), []
+    for row in rows:
+        row_number = positions.get(row[key_index])
+        if row_number is not None and row_number <= last_row and row_number not in occupied:
+            occupied.add(row_number)
+            if comparable(current[row_number - 1]) != comparable(row):
+                writes[row_number] = row
+        else:
+            pending.append(row)
+
+    holes = (row_number for row_number in range(2, last_row + 1) if row_number not in occupied)
+    for row in pending:
+        writes[next(holes)] = row
+
+    cleared = list(range(last_row + 1, len(current) + 1))
+    return writes, cleared
+
+def sync_to_google_sheets(df, spreadsheet_id: str, credentials_path: str = None, key_column: str = "Title",
+                          sheet_name: str = "Sheet1", snapshot_path: str = None, max_cells: int = 10000,
+                          service=None, removed=None):
+
+    try:
+        if service is None:
+            service = get_sheets_service(credentials_path)
+            if service is None:
+                return False
+        values_api = service.spreadsheets().values()
+
+        current = None
+        if snapshot_path and os.path.exists(snapshot_path):
+            with open(snapshot_path, encoding="utf-8") as f:
+                snapshot = json.load(f)
+            if snapshot.get("spreadsheet_id") == spreadsheet_id and snapshot.get("sheet") == sheet_name:
+                current = snapshot["values"]
+        if current is None:
+            response = _execute_with_retry(values_api.get(
+                spreadsheetId=spreadsheet_id,
+                range=sheet_name,
+                valueRenderOption='UNFORMATTED_VALUE'
+            ))
+            current = response.get('values', [])
+
+        header = df.columns.tolist()
+        rows = df.values.tolist()
+        if removed is not None and current:
+            header = current[0]
+            key_index = header.index(key_column)
+            delta = {row[key_index]: row for row in rows}
+            drop_keys = set(removed) | set(delta)
+            rows = [row for row in current[1:] if row and row[key_index] not in drop_keys] + list(delta.values())
+        writes, cleared = diff_sheet_rows(current, header, rows, key_column)
+        width = max([len(header)] + [len(row) for row in current])
+
+        for batch in _write_batches(writes, max_cells, width):
+            data = [{
+                'range': f"{sheet_name}!A{block[0]}",
+                'values': [writes[row_number] for row_number in block],
+            } for block in batch]
+            _execute_with_retry(values_api.batchUpdate(
+                spreadsheetId=spreadsheet_id,
+                body={'valueInputOption': 'RAW', 'data': data}
+            ))
+
+        if cleared:
+            _execute_with_retry(values_api.batchClear(
+                spreadsheetId=spreadsheet_id,
+                body={'ranges': [f"{sheet_name}!A{cleared[0]}:{_column_letter(width)}{cleared[-1]}"]}
+            ))
+
+        print(f"Sinkronisasi Google Sheets selesai: {len(writes)} baris ditulis, {len(cleared)} baris dihapus.")
+
+        if snapshot_path:
+            grid = [list(row) for row in current[:len(rows) + 1]]
+            for row_number, row in writes.items():
+                grid += [[] for _ in range(row_number - len(grid))]
+                grid[row_number - 1] = row
+            with open(snapshot_path, "w", encoding="utf-8") as f:
+                json.dump({"spreadsheet_id": spreadsheet_id, "sheet": sheet_name, "values": grid}, f)
+        return True
+
+    except Exception as e:
+        print(f"Terjadi kesalahan saat menyimpan ke Google Sheets: {e}")
+        return False
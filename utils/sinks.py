@@ -0,0 +1,20 @@
+class SinkRegistry:
+
+    def __init__(self):
+        self.factories = {}
+
+    def register(self, name: str):
+        def decorator(factory):
+            self.factories[name] = factory
+            return factory
+        return decorator
+
+    def names(self) -> list:
+        return list(self.factories)
+
+    def create(self, name: str, **options):
+        if name not in self.factories:
+            raise ValueError(f"Sink '{name}' tidak dikenal. Pilihan: {', '.join(self.factories)}")
+        return self.factories[name](**options)
+
+SINKS = SinkRegistry()
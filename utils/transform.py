@@ -1,44 +1,79 @@
 import pandas as pd
-import numpy as np
+from utils.metrics import METRICS
+from utils.records import ProductColumns
+from utils.validate import validate_products
 
-def transform_data(data: list) -> pd.DataFrame:
+USD_TO_IDR = 16000
 
-    try:
-        df = pd.DataFrame(data)
+ARROW_DTYPES = {
+    'Title': 'string[pyarrow]',
+    'Price': 'double[pyarrow]',
+    'Rating': 'double[pyarrow]',
+    'Colors': 'int64[pyarrow]',
+}
 
-        df.dropna(inplace=True)
-        df.drop_duplicates(inplace=True)
+def _quarantine(result, quarantine):
+    if result.rejected.empty:
+        return
+    print(f"{len(result.rejected)} baris ditolak validasi.")
+    if quarantine is not None:
+        quarantine(result.rejected)
 
-        df = df[df['Title'] != 'Unknown Product'].copy()
-        df = df[df['Price'] != 'Price Unavailable']
-        df = df[df['Rating'] != 'Not Rated']
+def transform_data(data: list, quarantine=None) -> pd.DataFrame:
 
-        df['Price'] = df['Price'].str.replace('$', '', regex=False).astype(float)
-        df['Price'] = df['Price'] * 16000
+    with METRICS.timer("transform"):
+        result = validate_products(data)
 
-        df['Rating'] = df['Rating'].str.extract(r'(\d+\.\d+)').astype(float)
+        with METRICS.timer("transform.astype"):
+            df = result.valid.assign(Price=result.valid['Price'] * USD_TO_IDR)
+            df = df.astype({
+                'Price': 'float64',
+                'Rating': 'float64',
+                'Colors': 'int64',
+                'Title': 'object',
+                'Size': 'object',
+                'Gender': 'object',
+                'timestamp': 'object' 
+            })
 
-        df['Colors'] = df['Colors'].str.extract(r'(\d+)').astype(float)
+    _quarantine(result, quarantine)
+    METRICS.incr("rows_transformed", len(df))
+    print("Transformasi data berhasil.")
+    return df
 
-        df['Size'] = df['Size'].str.replace('Size: ', '', regex=False)
+@METRICS.timed("transform")
+def transform_data_fast(data: list, dtype_backend: str = "numpy", quarantine=None) -> pd.DataFrame:
 
-        df['Gender'] = df['Gender'].str.replace('Gender: ', '', regex=False)
+    result = validate_products(data)
+    valid = result.valid
 
-        df.dropna(inplace=True)
+    df = valid.assign(
+        Price=valid['Price'] * USD_TO_IDR,
+        Size=valid['Size'].astype('category'),
+        Gender=valid['Gender'].astype('category'),
+        timestamp=pd.to_datetime(valid['timestamp'], format='ISO8601', errors='coerce'),
+    )
 
-        df = df.astype({
-            'Price': 'float64',
-            'Rating': 'float64',
-            'Colors': 'int64',
-            'Title': 'object',
-            'Size': 'object',
-            'Gender': 'object',
-            'timestamp': 'object' 
-        })
-        
-        print("Transformasi data berhasil.")
-        return df
+    if dtype_backend == "pyarrow":
+        df = df.astype(ARROW_DTYPES)
 
-    except Exception as e:
-        print(f"Terjadi kesalahan saat transformasi data: {e}")
-        return pd.DataFrame() 
\ No newline at end of file
+    _quarantine(result, quarantine)
+    METRICS.incr("rows_transformed", len(df))
+    print("Transformasi data berhasil.")
+    return df
+
+def transform_chunks(batches, chunk_size: int = 1000, transform=transform_data):
+
+    buffer = ProductColumns()
+    for batch in batches:
+        buffer.extend(batch)
+        if len(buffer) >= chunk_size:
+            df = transform(buffer)
+            buffer = ProductColumns()
+            if not df.empty:
+                yield df
+
+    if len(buffer):
+        df = transform(buffer)
+        if not df.empty:
+            yield df
@@ -0,0 +1,122 @@
+import re
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from utils.metrics import METRICS
+from utils.records import FIELDS, to_frame
+
+RATING_PATTERN = re.compile(r'(\d+\.\d+)')
+COLORS_PATTERN = re.compile(r'(\d+)')
+
+KNOWN_SIZES = ("XS", "S", "M", "L", "XL", "XXL", "XXXL")
+KNOWN_GENDERS = ("Men", "Women", "Unisex")
+
+REASONS = (
+    "missing_value",
+    "invalid_type",
+    "duplicate",
+    "unknown_title",
+    "price_unavailable",
+    "invalid_price",
+    "price_out_of_range",
+    "not_rated",
+    "invalid_rating",
+    "rating_out_of_range",
+    "invalid_colors",
+    "unknown_size",
+    "unknown_gender",
+)
+
+@dataclass
+class ValidationResult:
+    valid: pd.DataFrame
+    rejected: pd.DataFrame
+
+def _is_text(value) -> bool:
+    return isinstance(value, str) or value is None or value != value
+
+def _invalid_types(raw: pd.DataFrame) -> pd.Series:
+    invalid = pd.Series(False, index=raw.index)
+    for name in raw.columns:
+        if pd.api.types.infer_dtype(raw[name], skipna=True) not in ("string", "empty"):
+            invalid |= ~raw[name].map(_is_text).astype(bool)
+    return invalid
+
+def _take(values, codes: np.ndarray, fill) -> np.ndarray:
+    return np.append(np.asarray(values), fill)[codes]
+
+def reason_labels(codes: np.ndarray) -> dict:
+    return {
+        code: ";".join(name for bit, name in enumerate(REASONS) if code >> bit & 1)
+        for code in np.unique(codes).tolist()
+    }
+
+@METRICS.timed("validate")
+def validate_products(data) -> ValidationResult:
+    source = raw = to_frame(data).reindex(columns=list(FIELDS))
+    invalid_type = _invalid_types(raw)
+    if invalid_type.any():
+        raw = raw.astype("object").where(~invalid_type, None)
+
+    codes, uniques = {}, {}
+    for name in FIELDS:
+        codes[name], values = pd.factorize(raw[name])
+        uniques[name] = pd.Series(values, dtype="object")
+
+    price_text = uniques['Price']
+    price_values = pd.to_numeric(
+        price_text.str.replace('$', '', regex=False).str.replace(',', '', regex=False), errors='coerce'
+    ).astype('float64')
+    rating_values = pd.to_numeric(uniques['Rating'].str.extract(RATING_PATTERN, expand=False), errors='coerce').astype('float64')
+    colors_values = pd.to_numeric(uniques['Colors'].str.extract(COLORS_PATTERN, expand=False), errors='coerce').astype('float64')
+    size_values = uniques['Size'].str.replace('Size: ', '', regex=False)
+    gender_values = uniques['Gender'].str.replace('Gender: ', '', regex=False)
+
+    price_unavailable = price_text == 'Price Unavailable'
+    not_rated = uniques['Rating'].str.contains('Not Rated', regex=False, na=False)
+    per_value = {
+        "price_unavailable": ('Price', price_unavailable),
+        "invalid_price": ('Price', price_values.isna() & ~price_unavailable),
+        "price_out_of_range": ('Price', price_values <= 0),
+        "not_rated": ('Rating', not_rated),
+        "invalid_rating": ('Rating', rating_values.isna() & ~not_rated),
+        "rating_out_of_range": ('Rating', (rating_values < 0) | (rating_values > 5)),
+        "invalid_colors": ('Colors', colors_values.isna()),
+        "unknown_size": ('Size', ~size_values.isin(KNOWN_SIZES)),
+        "unknown_gender": ('Gender', ~gender_values.isin(KNOWN_GENDERS)),
+    }
+
+    invalid_type = invalid_type.to_numpy()
+    masks = {
+        "missing_value": np.column_stack([codes[name] < 0 for name in FIELDS]).any(axis=1) & ~invalid_type,
+        "invalid_type": invalid_type,
+        "duplicate": pd.DataFrame(codes).duplicated().to_numpy(),
+        "unknown_title": _take(uniques['Title'] == 'Unknown Product', codes['Title'], False),
+    }
+    for reason, (name, mask) in per_value.items():
+        masks[reason] = _take(mask, codes[name], False)
+
+    bits = np.zeros(len(raw), dtype=np.int64)
+    for bit, name in enumerate(REASONS):
+        bits |= masks[name].astype(np.int64) << bit
+    rejected_mask = bits != 0
+    keep = ~rejected_mask
+
+    valid = pd.DataFrame({
+        'Title': raw['Title'][keep],
+        'Price': _take(price_values, codes['Price'][keep], np.nan),
+        'Rating': _take(rating_values, codes['Rating'][keep], np.nan),
+        'Colors': _take(colors_values, codes['Colors'][keep], np.nan).astype('int64'),
+        'Size': _take(size_values, codes['Size'][keep], None),
+        'Gender': _take(gender_values, codes['Gender'][keep], None),
+        'timestamp': raw['timestamp'][keep],
+    }, index=raw.index[keep])
+
+    rejected_bits = bits[rejected_mask]
+    reasons = pd.Series(rejected_bits, index=raw.index[rejected_mask]).map(reason_labels(rejected_bits))
+    rejected = source[rejected_mask].assign(reason=reasons)
+
+    METRICS.incr("rows_rejected", len(rejected))
+    return ValidationResult(valid, rejected)